@@ -0,0 +1,115 @@
+"""
+Benchmark the time to import SQLLineage modules, which is paid on every cold start of the CLI or a short-lived worker.
+
+Each module is imported in a fresh interpreter with `python -X importtime`, and the cumulative time of the module is
+reported with min and median microseconds over the rounds, together with the packages it pulls in, e.g. sqlparse or
+networkx, so that an eager import of a heavy dependency shows up.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time -m sqllineage.runner -r 20 -o result.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+MODULES = ("sqllineage", "sqllineage.runner", "sqllineage.cli")
+TOP_PACKAGES = 10
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """
+    parse the stderr of `python -X importtime -c "import module"` into {name: cumulative microseconds}, for the module
+    and everything imported by it. Modules imported on interpreter startup are left out.
+    """
+    entries = []
+    for line in output.splitlines():
+        if line.startswith("import time:"):
+            _, cum, name = line.split("|")
+            if cum.strip().isdigit():
+                depth = (len(name) - len(name.lstrip())) // 2
+                entries.append((depth, name.strip(), int(cum)))
+    # importtime reports a module after its imports, so the module imported comes last, preceded by its subtree
+    depth, name, cum = entries[-1]
+    cumulative = {name: cum}
+    for sub_depth, sub_name, sub_cum in reversed(entries[:-1]):
+        if sub_depth <= depth:
+            break
+        cumulative.setdefault(sub_name, sub_cum)
+    return cumulative
+
+
+def import_once(module: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def benchmark(modules: List[str], repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for module in modules:
+        rounds = [import_once(module) for _ in range(repeat)]
+        root = module.split(".")[0]
+        packages = sorted(
+            {
+                name
+                for name in rounds[0]
+                if "." not in name and name != root and not name.startswith("_")
+            },
+            key=lambda name: -statistics.median(r.get(name, 0) for r in rounds),
+        )[:TOP_PACKAGES]
+        results[module] = {
+            "min": min(r[module] for r in rounds),
+            "median": statistics.median(r[module] for r in rounds),
+            "packages": {
+                name: statistics.median(r.get(name, 0) for r in rounds)
+                for name in packages
+            },
+        }
+        print(
+            f"{module}: {results[module]['median'] / 1000:.1f}ms, heaviest "
+            + ", ".join(
+                f"{name} {us / 1000:.1f}ms"
+                for name, us in list(results[module]["packages"].items())[:3]
+            ),
+            file=sys.stderr,
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="import time benchmark for SQLLineage")
+    parser.add_argument(
+        "-o", "--output", help="write JSON result to file, default to stdout"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=10, help="rounds per module"
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        action="append",
+        help="module to import, can be specified multiple times, default to %s"
+        % ", ".join(MODULES),
+    )
+    args = parser.parse_args()
+    content = json.dumps(benchmark(args.module or list(MODULES), args.repeat), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
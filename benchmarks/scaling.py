@@ -0,0 +1,90 @@
+"""
+Scaling benchmark over the synthetic workload in benchmarks/workload.py. Each workload is run with doubling sizes, and
+for each step, the growth exponent log(t2 / t1) / log(s2 / s1) of every phase is reported: ~1 for linear, ~2 for
+quadratic, and a keeping growing exponent hints at exponential behavior.
+
+Usage:
+    python -m benchmarks.scaling -o scaling.json
+    python -m benchmarks.scaling -w nested_subquery -w insert_dag
+"""
+
+import argparse
+import json
+import math
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.tpcds import PHASES, run_once
+from benchmarks.workload import WORKLOADS
+
+SIZES = {
+    "wide_select": [25, 50, 100, 200],
+    "nested_subquery": [10, 20, 40, 80],
+    "multi_join": [5, 10, 20, 40],
+    "union_chain": [10, 20, 40, 80],
+    "cte_chain": [10, 20, 40, 80],
+    "insert_dag": [50, 100, 200, 400],
+}
+
+
+def _exponent(size1: int, size2: int, time1: float, time2: float) -> float:
+    if time1 <= 0 or time2 <= 0:
+        return 0.0
+    return math.log(time2 / time1) / math.log(size2 / size1)
+
+
+def scale(workload: str, sizes: List[int], repeat: int) -> List[Dict[str, Any]]:
+    steps: List[Dict[str, Any]] = []
+    for size in sizes:
+        sql = WORKLOADS[workload](size)
+        rounds = [run_once(sql) for _ in range(repeat)]
+        timings = {phase: min(r[phase] for r in rounds) for phase in PHASES}
+        timings["total"] = sum(timings.values())
+        step: Dict[str, Any] = {"size": size, "seconds": timings}
+        if steps:
+            prev = steps[-1]
+            step["exponent"] = {
+                key: _exponent(prev["size"], size, prev["seconds"][key], value)
+                for key, value in timings.items()
+            }
+        steps.append(step)
+        print(
+            f"{workload} size {size}: {timings['total']:.4f}s"
+            + (
+                f", exponent {step['exponent']['total']:.2f}"
+                if "exponent" in step
+                else ""
+            ),
+            file=sys.stderr,
+        )
+    return steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="scaling benchmark for SQLLineage")
+    parser.add_argument(
+        "-o", "--output", help="write JSON result to file, default to stdout"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="rounds per size")
+    parser.add_argument(
+        "-w",
+        "--workload",
+        action="append",
+        choices=list(WORKLOADS),
+        help="workload to run, can be specified multiple times, default to all",
+    )
+    args = parser.parse_args()
+    result = {
+        workload: scale(workload, SIZES[workload], args.repeat)
+        for workload in args.workload or list(WORKLOADS)
+    }
+    content = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Benchmark SQLLineage over the bundled TPC-DS queries in sqllineage/data/tpcds.
+
+Each query is timed by phase, the same way LineageRunner works on it:
+    parse: split statements and group tokens with sqlparse
+    analyze: LineageAnalyzer on each statement
+    merge: combine statement lineage into SQLLineageHolder
+    column_lineage: SQLLineageHolder.get_column_lineage
+Each phase is repeated and reported with min and median seconds. Peak memory of a whole run for the query is measured
+separately with tracemalloc, as tracing distorts timing.
+
+Usage:
+    python -m benchmarks.tpcds -o result.json
+    python -m benchmarks.tpcds -o result.json --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import networkx
+import sqlparse
+from sqlparse.engine import grouping
+
+from sqllineage import VERSION
+from sqllineage.core.analyzer import LineageAnalyzer
+from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.utils.sqlparse import remove_values_payload, split_statements
+
+PHASES = ("parse", "analyze", "merge", "column_lineage")
+TPCDS_FOLDER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "sqllineage",
+    "data",
+    "tpcds",
+)
+
+
+def parse(sql: str) -> List[sqlparse.sql.Statement]:
+    return [
+        grouping.group(remove_values_payload(stmt))
+        for stmt in split_statements(sql.strip(), strip_comments=True)
+        if stmt.token_first(skip_cm=True)
+    ]
+
+
+def analyze(statements: List[sqlparse.sql.Statement]) -> List[Any]:
+    return [LineageAnalyzer().analyze(stmt) for stmt in statements]
+
+
+def merge(holders: List[Any]) -> SQLLineageHolder:
+    return SQLLineageHolder.of(*holders)
+
+
+def run_once(sql: str) -> Dict[str, float]:
+    timings = {}
+    start = time.perf_counter()
+    statements = parse(sql)
+    timings["parse"] = time.perf_counter() - start
+    start = time.perf_counter()
+    holders = analyze(statements)
+    timings["analyze"] = time.perf_counter() - start
+    start = time.perf_counter()
+    holder = merge(holders)
+    timings["merge"] = time.perf_counter() - start
+    start = time.perf_counter()
+    holder.get_column_lineage()
+    timings["column_lineage"] = time.perf_counter() - start
+    return timings
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def benchmark(queries: List[int], repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for number in queries:
+        name = f"query{number:02d}"
+        with open(os.path.join(TPCDS_FOLDER, f"{name}.sql")) as f:
+            sql = f.read()
+        rounds = [run_once(sql) for _ in range(repeat)]
+        result: Dict[str, Any] = {
+            phase: {
+                "min": min(r[phase] for r in rounds),
+                "median": statistics.median(r[phase] for r in rounds),
+            }
+            for phase in PHASES
+        }
+        result["peak_memory"] = peak_memory(lambda: run_once(sql))
+        results[name] = result
+        print(
+            f"{name}: "
+            + ", ".join(f"{phase} {result[phase]['median']:.4f}s" for phase in PHASES)
+            + f", peak memory {result['peak_memory'] / 1024 / 1024:.1f}MiB",
+            file=sys.stderr,
+        )
+    total = {
+        phase: sum(r[phase]["median"] for r in results.values()) for phase in PHASES
+    }
+    total["peak_memory"] = max(r["peak_memory"] for r in results.values())
+    return {
+        "metadata": {
+            "benchmark": "tpcds",
+            "sqllineage": VERSION,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sqlparse": sqlparse.__version__,
+            "networkx": networkx.__version__,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "total": total,
+        "queries": results,
+    }
+
+
+def _median(value: Any) -> float:
+    return value["median"] if isinstance(value, dict) else value
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> bool:
+    """
+    print to stderr the ratio of current to baseline for total and each query, return whether total time or peak
+    memory regresses beyond threshold.
+    """
+    keys = PHASES + ("peak_memory",)
+    print(f"{'':<16}" + "".join(f"{key:>16}" for key in keys), file=sys.stderr)
+    rows = [("total", baseline["total"], current["total"])] + [
+        (name, baseline["queries"][name], result)
+        for name, result in current["queries"].items()
+        if name in baseline["queries"]
+    ]
+    for name, old, new in rows:
+        ratios = []
+        for key in keys:
+            old_value, new_value = _median(old[key]), _median(new[key])
+            ratio = new_value / old_value if old_value else 1.0
+            ratios.append(ratio)
+        print(
+            f"{name:<16}" + "".join(f"{ratio:>15.2f}x" for ratio in ratios),
+            file=sys.stderr,
+        )
+    time_ratio = sum(current["total"][phase] for phase in PHASES) / sum(
+        baseline["total"][phase] for phase in PHASES
+    )
+    memory_ratio = current["total"]["peak_memory"] / baseline["total"]["peak_memory"]
+    print(
+        f"total time {time_ratio:.2f}x, peak memory {memory_ratio:.2f}x",
+        file=sys.stderr,
+    )
+    return time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TPC-DS benchmark for SQLLineage")
+    parser.add_argument(
+        "-o", "--output", help="write JSON result to file, default to stdout"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="rounds per query")
+    parser.add_argument(
+        "-q",
+        "--query",
+        type=int,
+        action="append",
+        help="query number to run, can be specified multiple times, default to all 99 queries",
+    )
+    parser.add_argument(
+        "--compare", metavar="<baseline.json>", help="compare with a previous result"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="exit with 1 when total time or peak memory regresses by more than this ratio, default to 0.1",
+    )
+    args = parser.parse_args()
+    result = benchmark(args.query or list(range(1, 100)), args.repeat)
+    content = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        print(content)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, result, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Synthetic SQL workload for scale testing. Each generator takes one size parameter and returns SQL whose cost grows with
+it, so that quadratic or exponential paths in analysis show up when the size is doubled.
+"""
+
+import random
+from typing import Callable, Dict
+
+
+def wide_select(columns: int) -> str:
+    """
+    INSERT ... SELECT with N columns
+    """
+    select = ", ".join(f"col{i}" for i in range(columns))
+    return f"INSERT INTO tab_target SELECT {select} FROM tab_source"
+
+
+def nested_subquery(depth: int) -> str:
+    """
+    INSERT ... SELECT with subqueries nested K levels deep
+    """
+    sql = "SELECT col1, col2 FROM tab_source"
+    for i in range(depth):
+        sql = f"SELECT col1, col2 FROM ({sql}) sq{i}"
+    return f"INSERT INTO tab_target {sql}"
+
+
+def multi_join(ways: int) -> str:
+    """
+    INSERT ... SELECT joining M tables
+    """
+    select = ", ".join(f"t{i}.col{i}" for i in range(ways))
+    joins = " ".join(f"JOIN tab{i} t{i} ON t0.id = t{i}.id" for i in range(1, ways))
+    return f"INSERT INTO tab_target SELECT {select} FROM tab0 t0 {joins}"
+
+
+def union_chain(length: int) -> str:
+    """
+    INSERT ... SELECT of a UNION ALL chain with the given number of branches
+    """
+    union = " UNION ALL ".join(f"SELECT col1, col2 FROM tab{i}" for i in range(length))
+    return f"INSERT INTO tab_target {union}"
+
+
+def cte_chain(count: int) -> str:
+    """
+    INSERT ... SELECT with the given number of CTEs, each selecting from the previous one
+    """
+    ctes = ["cte0 AS (SELECT col1, col2 FROM tab_source)"] + [
+        f"cte{i} AS (SELECT col1, col2 FROM cte{i - 1})" for i in range(1, count)
+    ]
+    return f"INSERT INTO tab_target WITH {', '.join(ctes)} SELECT col1, col2 FROM cte{count - 1}"
+
+
+def insert_dag(statements: int, fan_in: int = 2, seed: int = 0) -> str:
+    """
+    a script of INSERT ... SELECT statements forming a DAG, each statement joining up to fan_in tables written by
+    previous statements or the source tables.
+    """
+    rng = random.Random(seed)
+    sqls = []
+    for i in range(statements):
+        upstream = rng.sample(range(-fan_in, i), min(fan_in, i + fan_in))
+        tables = [f"src{-j}" if j < 0 else f"tab{j}" for j in upstream]
+        select = ", ".join(f"t{k}.col{k}" for k in range(len(tables)))
+        joins = " ".join(
+            f"JOIN {table} t{k} ON t0.id = t{k}.id"
+            for k, table in enumerate(tables)
+            if k > 0
+        )
+        sqls.append(f"INSERT INTO tab{i} SELECT {select} FROM {tables[0]} t0 {joins};")
+    return "\n".join(sqls)
+
+
+WORKLOADS: Dict[str, Callable[[int], str]] = {
+    "wide_select": wide_select,
+    "nested_subquery": nested_subquery,
+    "multi_join": multi_join,
+    "union_chain": union_chain,
+    "cte_chain": cte_chain,
+    "insert_dag": insert_dag,
+}
@@ -18,30 +18,87 @@ def _patch_adding_builtin_type() -> None:
 
 
 def _patch_updating_lateral_view_lexeme() -> None:
-    import re
-
     from sqlparse.keywords import SQL_REGEX
+    from sqlparse.lexer import Lexer
 
     for i, (regex, lexeme) in enumerate(SQL_REGEX):
-        rgx = re.compile(regex, re.IGNORECASE | re.UNICODE).match
-        if rgx("LATERAL VIEW EXPLODE(col)"):
+        # locate by pattern text instead of compiling every regex, which costs more than the rest of the patches
+        if regex.startswith(r"(LATERAL\s+VIEW\s+)"):
             new_regex = r"(LATERAL\s+VIEW\s+)(OUTER\s+)?(EXPLODE|INLINE|PARSE_URL_TUPLE|POSEXPLODE|STACK|JSON_TUPLE)\b"
             SQL_REGEX[i] = (new_regex, lexeme)
+            # regex is compiled when the lexer is first used, drop the lexer if sqlparse is already used before
+            # patching. Re-initializing it in place would leave it empty for a moment to threads tokenizing with it.
+            Lexer._default_intance = None
             break
 
 
+def _patch_thread_safe_lexer_instance() -> None:
+    import threading
+
+    from sqlparse.lexer import Lexer
+
+    lock = threading.Lock()
+
+    def get_default_instance(cls):
+        # the original one publishes the instance before initializing it, so another thread could tokenize with a
+        # lexer having no regex at all and get every character as an error token
+        if cls._default_intance is None:
+            with lock:
+                if cls._default_intance is None:
+                    lexer = cls()
+                    lexer.default_initialization()
+                    cls._default_intance = lexer
+        return cls._default_intance
+
+    Lexer.get_default_instance = classmethod(get_default_instance)
+
+
+def _patch_iterative_token_flatten() -> None:
+    from sqlparse.sql import TokenList
+
+    from sqllineage.utils.sqlparse import flatten
+
+    TokenList.flatten = flatten
+
+
+def _patch_picklable_token_type() -> None:
+    import copyreg
+
+    from sqlparse.tokens import _TokenType
+
+    from sqllineage.utils.sqlparse import get_token_type
+
+    copyreg.pickle(_TokenType, lambda ttype: (get_token_type, (tuple(ttype),)))
+
+
+_patched = False
+
+
 def _monkey_patch() -> None:
+    """
+    patch sqlparse once. This is called when sqllineage.utils.sqlparse is imported, i.e. by the time any sqllineage
+    module working on sqlparse is imported, rather than on importing sqllineage itself, which only needs the constants.
+
+    Threads importing sqllineage at the same time are serialized by the import lock of sqllineage.utils.sqlparse, so
+    the patches are applied exactly once without a lock here, which would cost importing threading.
+    """
+    global _patched
+    if _patched:
+        return
     try:
         _patch_adding_window_function_token()
         _patch_adding_builtin_type()
+        _patch_thread_safe_lexer_instance()
         _patch_updating_lateral_view_lexeme()
+        _patch_iterative_token_flatten()
+        _patch_picklable_token_type()
     except ImportError:
         # when imported by setup.py for constant variables, dependency is not ready yet
         pass
+    else:
+        _patched = True
 
 
-_monkey_patch()
-
 NAME = "metaphor-sqllineage"
 VERSION = "2.0.16"
 DEFAULT_LOGGING = {
@@ -0,0 +1,123 @@
+"""
+Asyncio API of SQLLineage, for services handling requests with an event loop.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import List, Optional, Tuple
+
+from sqllineage.core.models import Column, Table, TableMetadata
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import AnalysisLimits, LineageRunner, _SchemaPrefetch
+from sqllineage.utils.schemaFetcher import AsyncSchemaFetcher, PrefetchedSchemaFetcher
+
+
+class AsyncLineageRunner:
+    def __init__(
+        self,
+        sql: str,
+        table_metadata: Optional[TableMetadata] = None,
+        schema_fetcher: Optional[AsyncSchemaFetcher] = None,
+        encoding: Optional[str] = None,
+        limits: Optional[AnalysisLimits] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        The asyncio counterpart of :class:`sqllineage.runner.LineageRunner`. Parsing and analysis are CPU bound, so
+        they run in executor instead of blocking the event loop.
+
+        Schema lookups go through schema_fetcher. A table lineage only pass, which skips column resolution, first
+        collects the tables whose schema may be needed. Their schemas are then awaited concurrently in one round, and
+        the statements are fully analyzed once with them.
+
+        :param sql: a string representation of SQL statements.
+        :param table_metadata: metadata of the statements, the schema fetcher in it, if any, is called in executor
+        :param schema_fetcher: an :class:`sqllineage.utils.schemaFetcher.AsyncSchemaFetcher`, which is mutually
+            exclusive with the schema fetcher in table_metadata
+        :param encoding: the encoding for sql string
+        :param limits: per statement budgets as defined by :class:`sqllineage.runner.AnalysisLimits`
+        :param executor: a thread pool executor to run analysis in, default to the one of event loop
+        """
+        table_metadata = table_metadata or TableMetadata()
+        if schema_fetcher is not None and table_metadata.schema_fetcher is not None:
+            raise SQLLineageException(
+                "schema_fetcher and table_metadata.schema_fetcher can't be both set"
+            )
+        self._sql = sql
+        self._metadata = table_metadata
+        self._schema_fetcher = schema_fetcher
+        self._encoding = encoding
+        self._limits = limits
+        self._executor = executor
+        self._future: Optional["asyncio.Future[LineageRunner]"] = None
+
+    async def run(self) -> LineageRunner:
+        """
+        evaluate the lineage, returns the evaluated :class:`sqllineage.runner.LineageRunner`. Its table lineage can be
+        read without blocking, use :meth:`get_column_lineage` for column lineage, which is CPU bound.
+        """
+        if self._future is None:
+            self._future = asyncio.ensure_future(self._run())
+        return await self._future
+
+    async def source_tables(self) -> List[Table]:
+        """
+        a list of source :class:`sqllineage.models.Table`
+        """
+        tables: List[Table] = (await self.run()).source_tables
+        return tables
+
+    async def target_tables(self) -> List[Table]:
+        """
+        a list of target :class:`sqllineage.models.Table`
+        """
+        tables: List[Table] = (await self.run()).target_tables
+        return tables
+
+    async def intermediate_tables(self) -> List[Table]:
+        """
+        a list of intermediate :class:`sqllineage.models.Table`
+        """
+        tables: List[Table] = (await self.run()).intermediate_tables
+        return tables
+
+    async def get_column_lineage(
+        self, exclude_subquery=True
+    ) -> List[Tuple[Column, ...]]:
+        """
+        a list of column tuple :class:`sqllineage.models.Column`
+        """
+        runner = await self.run()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(runner.get_column_lineage, exclude_subquery),
+        )
+
+    async def _run(self) -> LineageRunner:
+        loop = asyncio.get_running_loop()
+        runner = LineageRunner(
+            self._sql, self._metadata, self._encoding, limits=self._limits
+        )
+        if self._schema_fetcher is None:
+            # accessing any result triggers the lazy evaluation
+            await loop.run_in_executor(self._executor, lambda: runner.warnings)
+            return runner
+        limits = self._limits or AnalysisLimits()
+        prefetch = await loop.run_in_executor(
+            self._executor,
+            lambda: _SchemaPrefetch(runner._parse(), self._metadata, limits),
+        )
+        schemas = (
+            await self._schema_fetcher.get_schemas(
+                prefetch.tables, self._metadata.platform, self._metadata.account
+            )
+            if prefetch.tables
+            else {}
+        )
+        # tables missing in the result are taken as having no schema
+        fetcher = PrefetchedSchemaFetcher(schemas)
+        await loop.run_in_executor(
+            self._executor, lambda: runner._merge(prefetch.analyze(fetcher))
+        )
+        return runner
@@ -0,0 +1,157 @@
+"""
+Batch analysis over a corpus of SQL files, with periodic checkpoints so that an interrupted job resumes from the files
+not done yet instead of starting over.
+
+The checkpoint is a pickle of (CHECKPOINT_VERSION, results), where results maps each finished file path to its
+:class:`FileResult`. Lineage holders in it are pickled with the compact encoding in sqllineage.core.serialization.
+A file failing the analysis is recorded with its error, so that it's not analyzed again on resume until modified.
+"""
+
+import logging
+import os
+import pickle  # nosec B403
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
+from sqllineage.core.models import TableMetadata
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import AnalysisLimits, LineageRunner
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+class FileResult(NamedTuple):
+    """
+    lineage of a SQL file, with the file size and modification time it's analyzed against, the seconds the analysis
+    takes, and the error if it fails, in which case holders is empty
+    """
+
+    size: int
+    mtime: float
+    holders: List[StatementLineageHolder]
+    warnings: List[str]
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+class BatchRunner:
+    def __init__(
+        self,
+        paths: Sequence[str],
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 60,
+        table_metadata: Optional[TableMetadata] = None,
+        encoding: Optional[str] = None,
+        limits: Optional[AnalysisLimits] = None,
+    ):
+        """
+        Analyze SQL files one by one, each file with a :class:`sqllineage.runner.LineageRunner`.
+
+        :param paths: paths of SQL files
+        :param checkpoint: path of the checkpoint file. When it exists, results for files unchanged since are loaded
+            from it and these files are not analyzed again.
+        :param checkpoint_interval: minimal seconds between two checkpoints. Checkpoint is also written when the run
+            finishes or is interrupted.
+        :param table_metadata: metadata passed to LineageRunner
+        :param encoding: encoding of SQL files
+        :param limits: limits passed to LineageRunner
+        """
+        self._paths = list(paths)
+        self._checkpoint = checkpoint
+        self._checkpoint_interval = checkpoint_interval
+        self._metadata = table_metadata
+        self._encoding = encoding
+        self._limits = limits
+        self.results: Dict[str, FileResult] = {}
+
+    def run(self) -> SQLLineageHolder:
+        """
+        analyze all the files not done yet, and combine the lineage of all files, in the order of paths.
+        """
+        self.results = self._load_checkpoint()
+        last_checkpoint = time.monotonic()
+        dirty = False
+        try:
+            for path in self._paths:
+                stat = os.stat(path)
+                done = self.results.get(path)
+                if (
+                    done is not None
+                    and done.size == stat.st_size
+                    and done.mtime == stat.st_mtime
+                ):
+                    continue
+                self.results[path] = self._analyze(path, stat.st_size, stat.st_mtime)
+                dirty = True
+                if time.monotonic() - last_checkpoint >= self._checkpoint_interval:
+                    self._save_checkpoint()
+                    last_checkpoint = time.monotonic()
+                    dirty = False
+        finally:
+            if dirty:
+                self._save_checkpoint()
+        sql_holder: SQLLineageHolder = SQLLineageHolder.of(
+            *[holder for path in self._paths for holder in self.results[path].holders]
+        )
+        return sql_holder
+
+    def _analyze(self, path: str, size: int, mtime: float) -> FileResult:
+        start = time.perf_counter()
+        try:
+            with open(path, encoding=self._encoding) as f:
+                sql = f.read()
+            runner = LineageRunner(
+                sql,
+                table_metadata=self._metadata,
+                encoding=self._encoding,
+                limits=self._limits,
+            )
+            # accessing warnings triggers the evaluation
+            warnings = runner.warnings
+        except Exception as e:  # noqa: B902
+            # a single file failing in any way should not stop the rest of the corpus from being analyzed
+            error = f"{type(e).__name__}: {e}"
+            logger.warning("Failed to analyze %s: %s", path, error)
+            return FileResult(size, mtime, [], [], error, time.perf_counter() - start)
+        return FileResult(
+            size,
+            mtime,
+            runner.statement_holders,
+            warnings,
+            elapsed=time.perf_counter() - start,
+        )
+
+    def _load_checkpoint(self) -> Dict[str, FileResult]:
+        if self._checkpoint is None or not os.path.exists(self._checkpoint):
+            return {}
+        with open(self._checkpoint, "rb") as f:
+            # the checkpoint is a local file written by BatchRunner itself
+            version, results = pickle.load(f)  # nosec B301
+        if version != CHECKPOINT_VERSION:
+            raise SQLLineageException(
+                "Unsupported checkpoint version %s, expecting %s"
+                % (version, CHECKPOINT_VERSION)
+            )
+        logger.info(
+            "%d files loaded from checkpoint %s", len(results), self._checkpoint
+        )
+        return {path: FileResult(*result) for path, result in results.items()}
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint is None:
+            return
+        # write to a temporary file first, so that a crash while writing leaves the previous checkpoint intact
+        tmp_path = self._checkpoint + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (
+                    CHECKPOINT_VERSION,
+                    {path: tuple(result) for path, result in self.results.items()},
+                ),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, self._checkpoint)
@@ -0,0 +1,255 @@
+"""
+Lineage catalog persisted in a local SQLite database, so that lineage of a SQL corpus can be updated file by file and
+consumed without re-running the whole corpus.
+
+Tables:
+    files: one row per SQL file, with the content hash and the compact encoded lineage graph of the file in JSON
+    provenance: one row per statement, with the statement index in file and the statement hash
+    nodes: one row per Table/Path/Column/SubQuery, identified by object kind and name
+    node_provenance: which statement a node comes from, with its tags in the file lineage as bitfield
+    edges: lineage edges, with the statement it comes from
+
+Each file's lineage is combined within the file as :class:`sqllineage.core.holders.SQLLineageHolder` does, the catalog
+lineage is the union of all the files.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+import networkx as nx
+
+from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.core.models import TableMetadata
+from sqllineage.core.serialization import (
+    decode_graph,
+    encode_graph,
+    encode_tags,
+    object_kind,
+)
+from sqllineage.runner import AnalysisLimits, LineageRunner
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL,
+    graph TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS provenance (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE,
+    statement_index INTEGER NOT NULL,
+    statement_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (kind, name)
+);
+CREATE TABLE IF NOT EXISTS node_provenance (
+    node_id INTEGER NOT NULL REFERENCES nodes (id),
+    provenance_id INTEGER NOT NULL REFERENCES provenance (id) ON DELETE CASCADE,
+    tags INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edges (
+    source_id INTEGER NOT NULL REFERENCES nodes (id),
+    target_id INTEGER NOT NULL REFERENCES nodes (id),
+    type INTEGER NOT NULL,
+    provenance_id INTEGER NOT NULL REFERENCES provenance (id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_provenance_file ON provenance (file_id);
+CREATE INDEX IF NOT EXISTS idx_node_provenance ON node_provenance (provenance_id);
+CREATE INDEX IF NOT EXISTS idx_node_provenance_node ON node_provenance (node_id);
+CREATE INDEX IF NOT EXISTS idx_edges_source ON edges (source_id);
+CREATE INDEX IF NOT EXISTS idx_edges_target ON edges (target_id);
+CREATE INDEX IF NOT EXISTS idx_edges_provenance ON edges (provenance_id);
+"""
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LineageCatalog:
+    def __init__(
+        self,
+        path: str,
+        table_metadata: Optional[TableMetadata] = None,
+        limits: Optional[AnalysisLimits] = None,
+    ):
+        """
+        Lineage catalog backed by SQLite database. It's created if not exists.
+
+        :param path: path of the SQLite database file, or ":memory:"
+        :param table_metadata: metadata passed to :class:`sqllineage.runner.LineageRunner`
+        :param limits: limits passed to :class:`sqllineage.runner.LineageRunner`
+        """
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+        self._metadata = table_metadata
+        self._limits = limits
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def update_file(
+        self, path: str, sql: Optional[str] = None, encoding: Optional[str] = None
+    ) -> bool:
+        """
+        analyze a SQL file and replace its previous contributions in catalog. File with unchanged content is not
+        analyzed again.
+
+        :param path: path of the SQL file, used as the key in catalog
+        :param sql: content of the file, read from path when not specified
+        :param encoding: encoding of the file
+        :return: whether catalog is updated
+        """
+        if sql is None:
+            with open(path, encoding=encoding) as f:
+                sql = f.read()
+        content_hash = _hash(sql)
+        row = self._conn.execute(
+            "SELECT content_hash FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None and row[0] == content_hash:
+            return False
+        runner = LineageRunner(
+            sql, table_metadata=self._metadata, encoding=encoding, limits=self._limits
+        )
+        statements = [stmt.value for stmt in runner.statements_parsed]
+        holders = runner.statement_holders
+        graph = SQLLineageHolder.of(*holders).graph
+        # lineage of each single statement, to tell which statement a node or an edge of the combined graph comes from
+        node_statements: Dict[Any, List[int]] = {}
+        edge_statement: Dict[Tuple[Any, Any], int] = {}
+        for i, holder in enumerate(holders):
+            statement_graph = SQLLineageHolder.of(holder).graph
+            for node in statement_graph.nodes:
+                node_statements.setdefault(node, []).append(i)
+            for edge in statement_graph.edges:
+                edge_statement.setdefault(edge, i)
+        with self._conn:
+            self._remove_file(path)
+            file_id = self._conn.execute(
+                "INSERT INTO files (path, content_hash, graph) VALUES (?, ?, ?)",
+                (
+                    path,
+                    content_hash,
+                    # encoded graph is made of builtin types only, no need for pickle
+                    json.dumps(encode_graph(graph), separators=(",", ":")),
+                ),
+            ).lastrowid
+            provenance_ids = [
+                self._conn.execute(
+                    "INSERT INTO provenance (file_id, statement_index, statement_hash) VALUES (?, ?, ?)",
+                    (file_id, i, _hash(statement)),
+                ).lastrowid
+                for i, statement in enumerate(statements)
+            ]
+            node_ids = {node: self._node_id(node) for node in graph.nodes}
+            node_provenance: List[Tuple[Any, ...]] = []
+            for node, attr in graph.nodes(data=True):
+                # nodes only showing up when combining statements, e.g. renamed table, go to the last statement
+                node_provenance.extend(
+                    (node_ids[node], provenance_ids[i], encode_tags(attr))
+                    for i in node_statements.get(node, [len(statements) - 1])
+                )
+            self._conn.executemany(
+                "INSERT INTO node_provenance (node_id, provenance_id, tags) VALUES (?, ?, ?)",
+                node_provenance,
+            )
+            edges = []
+            for src, tgt, attr in graph.edges(data=True):
+                # edges added when combining statements, e.g. resolved column, go to the last statement with target
+                statement_index = edge_statement.get(
+                    (src, tgt), node_statements.get(tgt, [len(statements) - 1])[-1]
+                )
+                edges.append(
+                    (
+                        node_ids[src],
+                        node_ids[tgt],
+                        attr["type"].value,
+                        provenance_ids[statement_index],
+                    )
+                )
+            self._conn.executemany(
+                "INSERT INTO edges (source_id, target_id, type, provenance_id) VALUES (?, ?, ?, ?)",
+                edges,
+            )
+        return True
+
+    def remove_file(self, path: str) -> None:
+        """
+        remove all the contributions of a SQL file from catalog
+        """
+        with self._conn:
+            self._remove_file(path)
+
+    def files(self) -> List[str]:
+        """
+        paths of all the files in catalog
+        """
+        return [
+            row[0] for row in self._conn.execute("SELECT path FROM files ORDER BY path")
+        ]
+
+    def lineage(self) -> SQLLineageHolder:
+        """
+        the lineage of all the files in catalog
+        """
+        graphs = [
+            decode_graph(json.loads(row[0]))
+            for row in self._conn.execute("SELECT graph FROM files ORDER BY path")
+        ]
+        return SQLLineageHolder(nx.compose_all(graphs) if graphs else nx.DiGraph())
+
+    def provenance(self, source: str, target: str) -> List[Tuple[str, int, str]]:
+        """
+        where the lineage edge between two nodes comes from, nodes being referred to by name, e.g. "<default>.tab1"
+        or "<default>.tab1.col1".
+
+        :return: a list of file path, statement index in file, statement hash
+        """
+        return self._conn.execute(
+            """SELECT f.path, p.statement_index, p.statement_hash
+FROM edges e
+         JOIN nodes s ON e.source_id = s.id
+         JOIN nodes t ON e.target_id = t.id
+         JOIN provenance p ON e.provenance_id = p.id
+         JOIN files f ON p.file_id = f.id
+WHERE s.name = ?
+  AND t.name = ?
+ORDER BY f.path, p.statement_index""",
+            (source, target),
+        ).fetchall()
+
+    def _node_id(self, node) -> int:
+        kind, name = object_kind(node), str(node)
+        row = self._conn.execute(
+            "SELECT id FROM nodes WHERE kind = ? AND name = ?", (kind, name)
+        ).fetchone()
+        if row is not None:
+            node_id: int = row[0]
+            return node_id
+        cursor = self._conn.execute(
+            "INSERT INTO nodes (kind, name) VALUES (?, ?)", (kind, name)
+        )
+        return cursor.lastrowid  # type: ignore
+
+    def _remove_file(self, path: str) -> None:
+        # provenance, node_provenance and edges are deleted in cascade
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        self._conn.execute("""DELETE FROM nodes
+WHERE id NOT IN (SELECT node_id FROM node_provenance)
+  AND id NOT IN (SELECT source_id FROM edges)
+  AND id NOT IN (SELECT target_id FROM edges)""")
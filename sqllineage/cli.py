@@ -3,7 +3,6 @@ import logging
 import logging.config
 
 from sqllineage import DEFAULT_HOST, DEFAULT_LOGGING, DEFAULT_PORT
-from sqllineage.drawing import draw_lineage_graph
 from sqllineage.runner import LineageRunner
 from sqllineage.utils.constant import LineageLevel
 from sqllineage.utils.helpers import extract_sql_from_args
@@ -84,6 +83,9 @@ def main(args=None) -> None:
         else:
             runner.print_table_lineage()
     elif args.graph_visualization:
+        # the http server machinery is only needed here, not imported on every run
+        from sqllineage.drawing import draw_lineage_graph
+
         return draw_lineage_graph(**{"host": args.host, "port": args.port})
     else:
         parser.print_help()
@@ -1,6 +1,8 @@
+import time
+from collections import deque
 from functools import reduce
 from operator import add
-from typing import Dict, List, NamedTuple, Optional, Set, Union
+from typing import Deque, Dict, List, NamedTuple, Optional, Set, Union
 
 from sqlparse.sql import (
     Function,
@@ -11,11 +13,13 @@ from sqlparse.sql import (
     Where,
 )
 
+from sqllineage.core.handlers import load_handlers
 from sqllineage.core.handlers.base import CurrentTokenBaseHandler, NextTokenBaseHandler
 from sqllineage.core.holders import StatementLineageHolder, SubQueryLineageHolder
 from sqllineage.core.models import Column, SubQuery, Table, TableMetadata
-from sqllineage.exceptions import SQLLineageException
+from sqllineage.exceptions import SQLLineageException, SQLLineageTimeoutException
 from sqllineage.utils.constant import EdgeType
+from sqllineage.utils.helpers import NON_LINEAGE_STATEMENT_KEYWORDS
 from sqllineage.utils.sqlparse import (
     get_subquery_parentheses,
     is_subquery,
@@ -23,30 +27,42 @@ from sqllineage.utils.sqlparse import (
 )
 
 
+class QueryFrame(NamedTuple):
+    holder: SubQueryLineageHolder
+    next_handlers: List[NextTokenBaseHandler]
+    subqueries: Deque[SubQuery]
+    target_table: Optional[Union[SubQuery, Table]]
+
+
 class AnalyzerContext(NamedTuple):
     subquery: Optional[SubQuery] = None
     prev_cte: Optional[Dict[SubQuery, Set[Column]]] = None
+    deadline: Optional[float] = None
+    column_lineage: bool = True
 
 
 class LineageAnalyzer:
     """SQL Statement Level Lineage Analyzer."""
 
     def analyze(
-        self, stmt: Statement, metadata=TableMetadata()
+        self,
+        stmt: Statement,
+        metadata=TableMetadata(),
+        deadline: Optional[float] = None,
+        column_lineage: bool = True,
     ) -> StatementLineageHolder:
         """
         to analyze the Statement and store the result into :class:`sqllineage.holders.StatementLineageHolder`.
 
         :param stmt: a SQL statement parsed by `sqlparse`
         :param metadata: metadata of the statement
+        :param deadline: a `time.monotonic` value, SQLLineageTimeoutException is raised when analysis runs past it
+        :param column_lineage: whether to resolve column lineage, table lineage only when False, which is much cheaper
         """
         if (
             stmt.get_type() == "DELETE"
-            or stmt.token_first(skip_cm=True).normalized == "TRUNCATE"
-            or stmt.token_first(skip_cm=True).normalized.upper() == "REFRESH"
-            or stmt.token_first(skip_cm=True).normalized == "CACHE"
-            or stmt.token_first(skip_cm=True).normalized.upper() == "UNCACHE"
-            or stmt.token_first(skip_cm=True).normalized == "SHOW"
+            or stmt.token_first(skip_cm=True).normalized.upper()
+            in NON_LINEAGE_STATEMENT_KEYWORDS
         ):
             holder = StatementLineageHolder()
         elif stmt.get_type() == "DROP":
@@ -59,7 +75,11 @@ class LineageAnalyzer:
         else:
             # DML parsing logic also applies to CREATE DDL
             holder = StatementLineageHolder.of(
-                self._extract_from_dml(stmt, AnalyzerContext(), metadata)
+                self._extract_from_dml(
+                    stmt,
+                    AnalyzerContext(deadline=deadline, column_lineage=column_lineage),
+                    metadata,
+                )
             )
         return holder
 
@@ -106,6 +126,43 @@ class LineageAnalyzer:
     def _extract_from_dml(
         cls, token: TokenList, context: AnalyzerContext, metadata: TableMetadata
     ) -> SubQueryLineageHolder:
+        """
+        Subqueries are walked depth-first with an explicit stack instead of recursion, so the nesting level is bounded
+        by heap rather than interpreter stack. Each subquery sees CTEs from its parent and previous sibling subqueries,
+        and gets merged into its parent before the parent's end of query cleanup.
+        """
+        root = cls._extract_query(token, context, metadata)
+        stack = [root]
+        while stack:
+            frame = stack[-1]
+            if frame.subqueries:
+                sq = frame.subqueries.popleft()
+                prev_cte = cls._find_cte_columns(frame.holder)
+                stack.append(
+                    cls._extract_query(
+                        sq.token,
+                        AnalyzerContext(
+                            sq, prev_cte, context.deadline, context.column_lineage
+                        ),
+                        metadata,
+                    )
+                )
+            else:
+                stack.pop()
+                for next_handler in frame.next_handlers:
+                    next_handler.end_of_query_cleanup(frame.holder, frame.target_table)
+                if stack:
+                    parent_holder = stack[-1].holder
+                    parent_holder |= frame.holder
+        return root.holder
+
+    @classmethod
+    def _extract_query(
+        cls, token: TokenList, context: AnalyzerContext, metadata: TableMetadata
+    ) -> QueryFrame:
+        """
+        Run the handlers through tokens of the query itself, with subqueries collected but not extracted yet.
+        """
         holder = SubQueryLineageHolder()
         if context.prev_cte is not None:
             # CTE can be referenced by subsequent CTEs
@@ -118,19 +175,23 @@ class LineageAnalyzer:
             # If within subquery, then manually add subquery as target table
             holder.add_write(context.subquery)
 
+        load_handlers()
         current_handlers = [
             handler_cls() for handler_cls in CurrentTokenBaseHandler.__subclasses__()
         ]
         next_handlers = [
-            handler_cls(metadata)
+            handler_cls(metadata, context.column_lineage)
             for handler_cls in NextTokenBaseHandler.__subclasses__()
         ]
 
-        subqueries = []
+        subqueries: Deque[SubQuery] = deque()
         for sub_token in token.tokens:
             if is_token_negligible(sub_token):
                 continue
 
+            if context.deadline is not None and time.monotonic() > context.deadline:
+                raise SQLLineageTimeoutException("Analysis runs past deadline")
+
             for sq in cls.parse_subquery(sub_token):
                 # Collecting subquery on the way, hold on parsing until last
                 # so that each handler don't have to worry about what's inside subquery
@@ -147,26 +208,14 @@ class LineageAnalyzer:
             for next_handler in next_handlers:
                 if next_handler.indicator:
                     next_handler.handle(sub_token, holder)
-        else:
-            # call end of query hook here as loop is over
-            target_table = None
-            if holder.write:
-                if len(holder.write) > 1:
-                    raise SQLLineageException
-                target_table = next(iter(holder.write))
-
-            # recursively extracting each subquery of the parent and merge
-            for sq in subqueries:
-                prev_cte = cls._find_cte_columns(holder)
-                sq_holder = cls._extract_from_dml(
-                    sq.token, AnalyzerContext(sq, prev_cte), metadata
-                )
-                holder |= sq_holder
-
-            for next_handler in next_handlers:
-                next_handler.end_of_query_cleanup(holder, target_table)
 
-        return holder
+        # end of query hook will be called with this target table after all subqueries are merged
+        target_table = None
+        if holder.write:
+            if len(holder.write) > 1:
+                raise SQLLineageException
+            target_table = next(iter(holder.write))
+        return QueryFrame(holder, next_handlers, subqueries, target_table)
 
     @classmethod
     def _find_cte_columns(
@@ -2,7 +2,17 @@ import importlib
 import os
 import pkgutil
 
-# Later we'll use BaseHandler's __subclasses__ hook to call each subclass, for that to work, we'll need to make sure
-# each module the subclass in is imported before calling the hook
-for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
-    importlib.import_module(__name__ + "." + module.name)
+_loaded = False
+
+
+def load_handlers() -> None:
+    """
+    Later we'll use BaseHandler's __subclasses__ hook to call each subclass, for that to work, we'll need to make sure
+    each module the subclass in is imported before calling the hook. This is done on first analysis instead of on
+    import, to keep importing sqllineage cheap.
+    """
+    global _loaded
+    if not _loaded:
+        for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
+            importlib.import_module(__name__ + "." + module.name)
+        _loaded = True
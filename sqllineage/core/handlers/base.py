@@ -11,9 +11,11 @@ class NextTokenBaseHandler:
     This is to address an extract pattern when a specified token indicates we should extract something from next token.
     """
 
-    def __init__(self, table_metadata=TableMetadata()) -> None:
+    def __init__(self, table_metadata=TableMetadata(), column_lineage=True) -> None:
         self.indicator = False
         self.table_metadata = table_metadata
+        # when False, only table lineage is extracted, column resolution being skipped
+        self.column_lineage = column_lineage
 
     def _indicate(self, token: Token) -> bool:
         """
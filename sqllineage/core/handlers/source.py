@@ -10,7 +10,7 @@ from sqlparse.sql import (
     Parenthesis,
     Token,
 )
-from sqlparse.tokens import Literal, Wildcard
+from sqlparse.tokens import Literal, Name, Punctuation, Wildcard
 
 from sqllineage.core.handlers.base import NextTokenBaseHandler
 from sqllineage.core.holders import SubQueryLineageHolder
@@ -34,12 +34,15 @@ class SourceHandler(NextTokenBaseHandler):
         r"((LEFT\s+|RIGHT\s+|FULL\s+)?(INNER\s+|OUTER\s+|STRAIGHT\s+)?|(CROSS\s+|NATURAL\s+)?)?JOIN",
     )
 
-    def __init__(self, table_metadata=TableMetadata()):
+    def __init__(self, table_metadata=TableMetadata(), column_lineage=True):
         self.column_flag = False
         self.columns = []
         self.tables = []
         self.union_barriers = []
-        super().__init__(table_metadata)
+        # for table lineage only, whether select list has wildcard or unqualified column, which may need schema
+        self.wildcard = False
+        self.unqualified = False
+        super().__init__(table_metadata, column_lineage)
 
     def _indicate(self, token: Token) -> bool:
         if token.normalized in ("UNION", "UNION ALL"):
@@ -58,7 +61,10 @@ class SourceHandler(NextTokenBaseHandler):
 
     def _handle(self, token: Token, holder: SubQueryLineageHolder) -> None:
         if self.column_flag:
-            self._handle_column(token)
+            if self.column_lineage:
+                self._handle_column(token)
+            else:
+                self._scan_column(token)
         else:
             self._handle_table(token, holder)
 
@@ -107,6 +113,21 @@ class SourceHandler(NextTokenBaseHandler):
         for token in column_tokens:
             self.columns.append(Column.of(token))
 
+    def _scan_column(self, token: Token) -> None:
+        """
+        tell whether there's wildcard or unqualified column from the leaf tokens, cheaper than Column.of
+        """
+        leaves = [t for t in token.flatten() if not t.is_whitespace]
+        for i, leaf in enumerate(leaves):
+            if leaf.ttype is Wildcard:
+                self.wildcard = True
+            elif leaf.ttype in Name:
+                qualified = (i > 0 and leaves[i - 1].match(Punctuation, ".")) or (
+                    i + 1 < len(leaves) and leaves[i + 1].match(Punctuation, ".")
+                )
+                if not qualified:
+                    self.unqualified = True
+
     def end_of_query_cleanup(
         self,
         holder: SubQueryLineageHolder,
@@ -114,6 +135,13 @@ class SourceHandler(NextTokenBaseHandler):
     ) -> None:
         for i, tbl in enumerate(self.tables):
             holder.add_read(tbl)
+        if not self.column_lineage:
+            if self.wildcard or (self.unqualified and len(self.tables) > 1):
+                # same condition as where Column.find_column_lineage looks up schema
+                for tbl in self.tables:
+                    if isinstance(tbl, Table):
+                        holder.add_schema(tbl)
+            return
         subquery_columns = self._find_subquery_columns(holder)
 
         # match source column qualifier based on all the table alias
@@ -1,13 +1,49 @@
 import itertools
-from typing import List, Optional, Set, Tuple, Union
-
-import networkx as nx
-from networkx import DiGraph
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from sqllineage.core.models import Column, Path, SubQuery, Table
+from sqllineage.core.serialization import EncodedGraph, decode_graph, encode_graph
 from sqllineage.utils.constant import EdgeType, NodeTag
 
+if TYPE_CHECKING:
+    from networkx import DiGraph
+
 DATASET_CLASSES = (Path, Table)
+T = TypeVar("T")
+
+_nx: Any = None
+
+
+def _networkx() -> Any:
+    """
+    networkx module imported on first use, as it takes most of the time to import sqllineage
+    """
+    global _nx
+    if _nx is None:
+        import networkx
+
+        _nx = networkx
+    return _nx
+
+
+def _decode_holder(cls, data: EncodedGraph):
+    graph = decode_graph(data)
+    if issubclass(cls, SQLLineageHolder):
+        return cls(graph)
+    holder = cls()
+    holder.graph = graph
+    return holder
 
 
 class ColumnLineageMixin:
@@ -47,6 +83,7 @@ class ColumnLineageMixin:
                 )
             }
 
+        nx = _networkx()
         columns = set()
         for source, target in itertools.product(source_columns, target_columns):
             simple_paths = list(nx.all_simple_paths(self.graph, source, target))
@@ -67,10 +104,15 @@ class SubQueryLineageHolder(ColumnLineageMixin):
     """
 
     def __init__(self) -> None:
-        self.graph = nx.DiGraph()
+        self.graph = _networkx().DiGraph()
+
+    def __reduce__(self):
+        # pickle with the compact graph encoding, leaving out sqlparse token trees
+        return _decode_holder, (type(self), encode_graph(self.graph))
 
     def __or__(self, other):
-        self.graph = nx.compose(self.graph, other.graph)
+        # merge in place, same as nx.compose, attributes from the other graph take precedence
+        self.graph.update(other.graph)
         return self
 
     def _property_getter(self, prop) -> Set[Union[SubQuery, Table]]:
@@ -83,6 +125,13 @@ class SubQueryLineageHolder(ColumnLineageMixin):
     def read(self) -> Set[Union[SubQuery, Table]]:
         return self._property_getter(NodeTag.READ)
 
+    @property
+    def schema(self) -> Set[Union[SubQuery, Table]]:
+        return self._property_getter(NodeTag.SCHEMA)
+
+    def add_schema(self, value) -> None:
+        self._property_setter(value, NodeTag.SCHEMA)
+
     def add_read(self, value) -> None:
         self._property_setter(value, NodeTag.READ)
         # the same table can be added (in SQL: joined) multiple times with different alias
@@ -169,88 +218,200 @@ class StatementLineageHolder(SubQueryLineageHolder, ColumnLineageMixin):
 
 
 class SQLLineageHolder(ColumnLineageMixin):
-    def __init__(self, graph: DiGraph):
+    def __init__(self, graph: "DiGraph"):
         """
         The combined lineage result in representation of Directed Acyclic Graph.
 
+        Derived views like table_lineage_graph or source_tables are computed once on first access and cached. Assigning
+        a new graph resets the cache, call :meth:`invalidate` if the graph is modified in place.
+
         :param graph: the Directed Acyclic Graph holding all the combined lineage result.
         """
         self.graph = graph
-        self._selfloop_tables = self.__retrieve_tag_tables(NodeTag.SELFLOOP)
-        self._sourceonly_tables = self.__retrieve_tag_tables(NodeTag.SOURCE_ONLY)
-        self._targetonly_tables = self.__retrieve_tag_tables(NodeTag.TARGET_ONLY)
+        self.invalidate()
+
+    def __reduce__(self):
+        # pickle with the compact graph encoding, leaving out sqlparse token trees
+        return _decode_holder, (type(self), encode_graph(self.graph))
+
+    def invalidate(self) -> None:
+        """
+        drop the cached views derived from graph
+        """
+        self._views: Dict[str, Any] = {}
+        self._views_graph = self.graph
+
+    def _cached(self, key: str, func: Callable[[], T]) -> T:
+        if self._views_graph is not self.graph:
+            # graph is reassigned since the views are computed
+            self.invalidate()
+        if key not in self._views:
+            self._views[key] = func()
+        value: T = self._views[key]
+        return value
 
     @property
-    def table_lineage_graph(self) -> DiGraph:
+    def table_lineage_graph(self) -> "DiGraph":
         """
         The table level DiGraph held by SQLLineageHolder
         """
-        table_nodes = [n for n in self.graph.nodes if isinstance(n, DATASET_CLASSES)]
-        return self.graph.subgraph(table_nodes)
+
+        def _table_lineage_graph() -> "DiGraph":
+            table_nodes = [
+                n for n in self.graph.nodes if isinstance(n, DATASET_CLASSES)
+            ]
+            return self.graph.subgraph(table_nodes)
+
+        return self._cached("table_lineage_graph", _table_lineage_graph)
 
     @property
-    def column_lineage_graph(self) -> DiGraph:
+    def column_lineage_graph(self) -> "DiGraph":
         """
         The column level DiGraph held by SQLLineageHolder
         """
-        column_nodes = [n for n in self.graph.nodes if isinstance(n, Column)]
-        return self.graph.subgraph(column_nodes)
+
+        def _column_lineage_graph() -> "DiGraph":
+            column_nodes = [n for n in self.graph.nodes if isinstance(n, Column)]
+            return self.graph.subgraph(column_nodes)
+
+        return self._cached("column_lineage_graph", _column_lineage_graph)
 
     @property
     def source_tables(self) -> Set[Table]:
         """
         a list of source :class:`sqllineage.models.Table`
         """
-        source_tables = {
-            table for table, deg in self.table_lineage_graph.in_degree if deg == 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.out_degree if deg > 0}
-        )
-        source_tables |= self._selfloop_tables
-        source_tables |= self._sourceonly_tables
-        return source_tables
+
+        def _source_tables() -> Set[Table]:
+            source_tables = {
+                table
+                for table, (in_deg, out_deg) in self._table_degrees.items()
+                if in_deg == 0 and out_deg > 0
+            }
+            source_tables |= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
+            source_tables |= self.__retrieve_tag_tables(NodeTag.SOURCE_ONLY)
+            return source_tables
+
+        # a copy, so that the cached set is never modified by callers
+        return set(self._cached("source_tables", _source_tables))
 
     @property
     def target_tables(self) -> Set[Table]:
         """
         a list of target :class:`sqllineage.models.Table`
         """
-        target_tables = {
-            table for table, deg in self.table_lineage_graph.out_degree if deg == 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.in_degree if deg > 0}
-        )
-        target_tables |= self._selfloop_tables
-        target_tables |= self._targetonly_tables
-        return target_tables
+
+        def _target_tables() -> Set[Table]:
+            target_tables = {
+                table
+                for table, (in_deg, out_deg) in self._table_degrees.items()
+                if out_deg == 0 and in_deg > 0
+            }
+            target_tables |= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
+            target_tables |= self.__retrieve_tag_tables(NodeTag.TARGET_ONLY)
+            return target_tables
+
+        return set(self._cached("target_tables", _target_tables))
 
     @property
     def intermediate_tables(self) -> Set[Table]:
         """
         a list of intermediate :class:`sqllineage.models.Table`
         """
-        intermediate_tables = {
-            table for table, deg in self.table_lineage_graph.in_degree if deg > 0
-        }.intersection(
-            {table for table, deg in self.table_lineage_graph.out_degree if deg > 0}
+
+        def _intermediate_tables() -> Set[Table]:
+            intermediate_tables = {
+                table
+                for table, (in_deg, out_deg) in self._table_degrees.items()
+                if in_deg > 0 and out_deg > 0
+            }
+            intermediate_tables -= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
+            return intermediate_tables
+
+        return set(self._cached("intermediate_tables", _intermediate_tables))
+
+    @property
+    def _table_degrees(self) -> Dict[Any, Tuple[int, int]]:
+        """
+        in degree and out degree for each table in table_lineage_graph
+        """
+
+        def _degrees() -> Dict[Any, Tuple[int, int]]:
+            graph = self.table_lineage_graph
+            return {
+                table: (graph.in_degree(table), graph.out_degree(table))
+                for table in graph.nodes
+            }
+
+        return self._cached("table_degrees", _degrees)
+
+    def upstream(
+        self, node: Union[Column, Path, Table], depth: Optional[int] = None
+    ) -> "DiGraph":
+        """
+        The subgraph of node and everything it's derived from, i.e. source tables of a table, or source columns of a
+        column, at table or column level respectively.
+
+        :param node: a :class:`sqllineage.models.Table` or :class:`sqllineage.models.Column`
+        :param depth: maximum number of hops from node, None for no limit
+        """
+        return self._traverse(node, depth, upstream=True)
+
+    def downstream(
+        self, node: Union[Column, Path, Table], depth: Optional[int] = None
+    ) -> "DiGraph":
+        """
+        The subgraph of node and everything derived from it, i.e. what is impacted when the table or column changes.
+
+        :param node: a :class:`sqllineage.models.Table` or :class:`sqllineage.models.Column`
+        :param depth: maximum number of hops from node, None for no limit
+        """
+        return self._traverse(node, depth, upstream=False)
+
+    def _traverse(
+        self, node: Union[Column, Path, Table], depth: Optional[int], upstream: bool
+    ) -> "DiGraph":
+        graph = (
+            self.column_lineage_graph
+            if isinstance(node, Column)
+            else self.table_lineage_graph
         )
-        intermediate_tables -= self.__retrieve_tag_tables(NodeTag.SELFLOOP)
-        return intermediate_tables
+        if node not in graph:
+            return graph.subgraph([])
+        adjacency = graph.pred if upstream else graph.succ
+        visited = {node}
+        frontier = [node]
+        hops = 0
+        # breadth first, level by level so that depth is counted in hops
+        while frontier and (depth is None or hops < depth):
+            next_frontier = []
+            for current in frontier:
+                for neighbor in adjacency[current]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+            hops += 1
+        return graph.subgraph(visited)
 
     def __retrieve_tag_tables(self, tag) -> Set[Union[Path, Table]]:
-        return {
-            table
-            for table, attr in self.graph.nodes(data=True)
-            if attr.get(tag) is True and isinstance(table, DATASET_CLASSES)
-        }
+        def _tag_tables() -> Set[Union[Path, Table]]:
+            return {
+                table
+                for table, attr in self.graph.nodes(data=True)
+                if attr.get(tag) is True and isinstance(table, DATASET_CLASSES)
+            }
+
+        return self._cached(f"tag_{tag}", _tag_tables)
 
     @staticmethod
-    def _build_digraph(*args: StatementLineageHolder) -> DiGraph:
+    def _build_digraph(*args: StatementLineageHolder) -> "DiGraph":
         """
         To assemble multiple :class:`sqllineage.holders.StatementLineageHolder` into
         :class:`sqllineage.holders.SQLLineageHolder`
         """
-        g = DiGraph()
+        nx = _networkx()
+        g = nx.DiGraph()
         for holder in args:
             g = nx.compose(g, holder.graph)
             if holder.drop:
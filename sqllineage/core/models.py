@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import warnings
 from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
@@ -75,8 +76,15 @@ class TableMetadata(NamedTuple):
         if not self.schema_fetcher:
             return []
 
-        fullname = table_fullname(table, self.default_database, self.default_schema)
-        return self.schema_fetcher.get_schema(fullname, self.platform, self.account)
+        return self.schema_fetcher.get_schema(
+            self.table_fullname(table), self.platform, self.account
+        )
+
+    def table_fullname(self, table: str) -> str:
+        """
+        the table name passed to schema fetcher, assembled with default database and schema in this object
+        """
+        return table_fullname(table, self.default_database, self.default_schema)
 
 
 class Table:
@@ -161,7 +169,13 @@ class SubQuery:
         """
         self.token = token
         self._query = token.value
-        self.alias = alias.lower() if alias is not None else f"subquery_{hash(self)}"
+        # digest instead of built-in hash, which is randomized per process, so that the name is stable across runs
+        self.alias = (
+            alias.lower()
+            if alias is not None
+            else "subquery_"
+            + hashlib.sha256(self._query.encode("utf-8")).hexdigest()[:16]
+        )
 
     def __str__(self):
         return self.alias
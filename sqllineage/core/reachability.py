@@ -0,0 +1,123 @@
+from typing import Any, Dict, Hashable, Iterable, List, Set, Tuple
+
+import networkx as nx
+from networkx import DiGraph
+
+
+def _iter_bits(bits: int) -> Iterable[int]:
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class ReachabilityIndex:
+    def __init__(self, graph: DiGraph):
+        """
+        Transitive closure of a lineage graph, e.g. table_lineage_graph or column_lineage_graph of
+        :class:`sqllineage.core.holders.SQLLineageHolder`, kept as a descendant bitset and an ancestor bitset per node.
+        "Is X upstream of Y" is a single bit test, and all descendants of X are decoded from one bitset.
+
+        The index is built over the condensation of the graph, so cycles like self-loop tables are handled. It can be
+        updated incrementally with new nodes and edges, but not with removal.
+
+        :param graph: the lineage graph to index
+        """
+        self._ids: Dict[Hashable, int] = {}
+        self._nodes: List[Hashable] = []
+        self._descendants: List[int] = []
+        self._ancestors: List[int] = []
+        for node in graph.nodes:
+            self.add_node(node)
+        condensation = nx.condensation(graph)
+        members = {
+            scc: sum(1 << self._ids[n] for n in attr["members"])
+            for scc, attr in condensation.nodes(data=True)
+        }
+        order = list(nx.topological_sort(condensation))
+        scc_descendants: Dict[int, int] = {}
+        for scc in reversed(order):
+            bits = 0
+            for succ in condensation.succ[scc]:
+                bits |= members[succ] | scc_descendants[succ]
+            scc_descendants[scc] = bits
+        scc_ancestors: Dict[int, int] = {}
+        for scc in order:
+            bits = 0
+            for pred in condensation.pred[scc]:
+                bits |= members[pred] | scc_ancestors[pred]
+            scc_ancestors[scc] = bits
+        for scc, attr in condensation.nodes(data=True):
+            scc_members = attr["members"]
+            # a node reaches itself only when it's on a cycle
+            cyclic = len(scc_members) > 1 or any(
+                graph.has_edge(n, n) for n in scc_members
+            )
+            self_bits = members[scc] if cyclic else 0
+            for node in scc_members:
+                self._descendants[self._ids[node]] = scc_descendants[scc] | self_bits
+                self._ancestors[self._ids[node]] = scc_ancestors[scc] | self_bits
+
+    def __contains__(self, node: Any) -> bool:
+        return node in self._ids
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add_node(self, node: Hashable) -> None:
+        if node not in self._ids:
+            self._ids[node] = len(self._nodes)
+            self._nodes.append(node)
+            self._descendants.append(0)
+            self._ancestors.append(0)
+
+    def add_edge(self, source: Hashable, target: Hashable) -> None:
+        """
+        add an edge, updating the closure of the ancestors of source and descendants of target
+        """
+        self.add_node(source)
+        self.add_node(target)
+        src, tgt = self._ids[source], self._ids[target]
+        if (self._descendants[src] >> tgt) & 1:
+            # already reachable, closure unchanged
+            return
+        ancestors = self._ancestors[src] | (1 << src)
+        descendants = self._descendants[tgt] | (1 << tgt)
+        for i in _iter_bits(ancestors):
+            self._descendants[i] |= descendants
+        for i in _iter_bits(descendants):
+            self._ancestors[i] |= ancestors
+
+    def add_edges_from(self, edges: Iterable[Tuple[Hashable, Hashable]]) -> None:
+        """
+        add edges of new statements, e.g. edges of the lineage graph of a StatementLineageHolder
+        """
+        for source, target in edges:
+            self.add_edge(source, target)
+
+    def is_upstream(self, source: Hashable, target: Hashable) -> bool:
+        """
+        whether there's a lineage path from source to target
+        """
+        src, tgt = self._ids.get(source), self._ids.get(target)
+        if src is None or tgt is None:
+            return False
+        return bool((self._descendants[src] >> tgt) & 1)
+
+    def descendants(self, node: Hashable) -> Set[Hashable]:
+        """
+        all the nodes derived from node, directly or indirectly
+        """
+        idx = self._ids.get(node)
+        if idx is None:
+            return set()
+        return {self._nodes[i] for i in _iter_bits(self._descendants[idx])}
+
+    def ancestors(self, node: Hashable) -> Set[Hashable]:
+        """
+        all the nodes that node is derived from, directly or indirectly
+        """
+        idx = self._ids.get(node)
+        if idx is None:
+            return set()
+        return {self._nodes[i] for i in _iter_bits(self._ancestors[idx])}
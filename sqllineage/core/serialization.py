@@ -0,0 +1,181 @@
+"""
+Compact encoding of lineage graph, used for pickling lineage holders.
+
+The graph is encoded into plain tuples of builtin types:
+    (FORMAT_VERSION, objects, nodes, edges)
+
+objects is the interned table of every Table/Path/SubQuery/Column/alias referenced, including parent candidates of
+columns that are not graph nodes. nodes is a tuple of (object index, tag bitfield), and edges is a tuple of
+(source index, target index, edge type value).
+
+Only what's needed for lineage result is kept. sqlparse token trees are left out, so after decoding, SubQuery.token
+is None, and Column has neither its source columns nor expression.
+"""
+
+from typing import Any, Dict, List, TYPE_CHECKING, Tuple, Union
+
+from sqllineage.core.models import Column, Path, Schema, SubQuery, Table
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.utils.constant import EdgeType, NodeTag
+from sqllineage.utils.entities import ColumnExpression, ColumnQualifierTuple
+
+if TYPE_CHECKING:
+    from networkx import DiGraph
+
+FORMAT_VERSION = 1
+
+TAGS = (
+    NodeTag.READ,
+    NodeTag.WRITE,
+    NodeTag.CTE,
+    NodeTag.DROP,
+    NodeTag.SOURCE_ONLY,
+    NodeTag.TARGET_ONLY,
+    NodeTag.SELFLOOP,
+)
+
+OBJECT_STR = 0
+OBJECT_TABLE = 1
+OBJECT_PATH = 2
+OBJECT_SUBQUERY = 3
+OBJECT_COLUMN = 4
+
+Node = Union[Column, Path, SubQuery, Table, str]
+EncodedGraph = Tuple[
+    int,
+    Tuple[Tuple[Any, ...], ...],
+    Tuple[Tuple[int, int], ...],
+    Tuple[Tuple[int, int, int], ...],
+]
+
+
+def object_kind(obj: Node) -> int:
+    """
+    the OBJECT_* kind of a graph node
+    """
+    if isinstance(obj, Column):
+        return OBJECT_COLUMN
+    elif isinstance(obj, Table):
+        return OBJECT_TABLE
+    elif isinstance(obj, SubQuery):
+        return OBJECT_SUBQUERY
+    elif isinstance(obj, Path):
+        return OBJECT_PATH
+    else:
+        return OBJECT_STR
+
+
+def encode_tags(attr: Dict[str, Any]) -> int:
+    """
+    node tags as a bitfield, bit i set for TAGS[i]
+    """
+    return sum(1 << i for i, tag in enumerate(TAGS) if attr.get(tag) is True)
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.objects: List[Tuple[Any, ...]] = []
+        self.index: Dict[Tuple[type, Node], int] = {}
+
+    def intern(self, obj: Node) -> int:
+        # key by type as well, since Table and Column could be equal in string representation
+        key = (type(obj), obj)
+        idx = self.index.get(key)
+        if idx is None:
+            encoded = self._encode(obj)
+            idx = self.index[key] = len(self.objects)
+            self.objects.append(encoded)
+        return idx
+
+    def _encode(self, obj: Node) -> Tuple[Any, ...]:
+        if isinstance(obj, Column):
+            # parent candidates are encoded before the column itself
+            parents = tuple(self.intern(p) for p in obj.parent_candidates)
+            return OBJECT_COLUMN, obj.raw_name, parents
+        elif isinstance(obj, Table):
+            return OBJECT_TABLE, obj.raw_name, obj.schema.raw_name, obj.alias
+        elif isinstance(obj, SubQuery):
+            return OBJECT_SUBQUERY, obj._query, obj.alias
+        elif isinstance(obj, Path):
+            return OBJECT_PATH, obj.uri
+        elif isinstance(obj, str):
+            return OBJECT_STR, obj
+        else:
+            raise SQLLineageException("Unable to encode %r" % obj)
+
+
+def _decode(encoded: Tuple[Any, ...], objects: List[Node]) -> Node:
+    # objects are restored without calling __init__, as the attributes are already escaped and split
+    kind = encoded[0]
+    obj: Node
+    if kind == OBJECT_COLUMN:
+        _, raw_name, parents = encoded
+        obj = Column.__new__(Column)
+        obj._parent = {objects[p] for p in parents}
+        obj.raw_name = raw_name
+        obj.source_columns = [ColumnQualifierTuple(raw_name, None)]
+        obj.expression = ColumnExpression(True, None)
+    elif kind == OBJECT_TABLE:
+        _, raw_name, schema_name, alias = encoded
+        schema = Schema.__new__(Schema)
+        schema.raw_name = schema_name
+        obj = Table.__new__(Table)
+        obj.schema = schema
+        obj.raw_name = raw_name
+        obj.alias = alias
+    elif kind == OBJECT_SUBQUERY:
+        _, query, alias = encoded
+        obj = SubQuery.__new__(SubQuery)
+        obj.token = None
+        obj._query = query
+        obj.alias = alias
+    elif kind == OBJECT_PATH:
+        obj = Path.__new__(Path)
+        obj.uri = encoded[1]
+    elif kind == OBJECT_STR:
+        obj = encoded[1]
+    else:
+        raise SQLLineageException("Unknown object kind %s" % kind)
+    return obj
+
+
+def encode_graph(graph: "DiGraph") -> EncodedGraph:
+    """
+    encode the lineage graph into compact tuples of builtin types.
+    """
+    interner = _Interner()
+    nodes = tuple(
+        (interner.intern(node), encode_tags(attr))
+        for node, attr in graph.nodes(data=True)
+    )
+    edges = tuple(
+        (interner.intern(src), interner.intern(tgt), attr["type"].value)
+        for src, tgt, attr in graph.edges(data=True)
+    )
+    return FORMAT_VERSION, tuple(interner.objects), nodes, edges
+
+
+def decode_graph(data: EncodedGraph) -> "DiGraph":
+    """
+    decode the lineage graph encoded by encode_graph.
+    """
+    import networkx as nx
+
+    version, encoded_objects, nodes, edges = data
+    if version != FORMAT_VERSION:
+        raise SQLLineageException(
+            "Unsupported format version %s, expecting %s" % (version, FORMAT_VERSION)
+        )
+    objects: List[Node] = []
+    for encoded in encoded_objects:
+        objects.append(_decode(encoded, objects))
+    graph = nx.DiGraph()
+    graph.add_nodes_from(
+        (objects[idx], {tag: True for i, tag in enumerate(TAGS) if tags & (1 << i)})
+        for idx, tags in nodes
+    )
+    graph.add_edges_from(
+        (objects[src], objects[tgt], {"type": EdgeType(edge_type)})
+        for src, tgt, edge_type in edges
+    )
+    return graph
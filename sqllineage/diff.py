@@ -0,0 +1,88 @@
+"""
+Diff of lineage between two versions of a SQL corpus. Both sides are reduced to sets of hashable node keys and edge
+keys, so the diff is two set differences instead of comparing column lineage paths pair by pair.
+"""
+
+from typing import NamedTuple, Set, Tuple, Union
+
+from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.core.serialization import (
+    OBJECT_COLUMN,
+    OBJECT_PATH,
+    OBJECT_TABLE,
+    object_kind,
+)
+from sqllineage.snapshot import LineageSnapshot
+from sqllineage.utils.constant import EdgeType
+
+NodeKey = Tuple[int, str]
+EdgeKey = Tuple[NodeKey, NodeKey, int]
+
+
+class LineageDiff(NamedTuple):
+    """
+    Tables and columns are referred to by name, e.g. "<default>.tab1" and "<default>.tab1.col1". Edges are tuples of
+    (source name, target name, :class:`sqllineage.utils.constant.EdgeType`), including edges from or to subqueries,
+    which are named by their alias, or by a digest of the query without alias, stable across processes.
+    """
+
+    added_tables: Set[str]
+    removed_tables: Set[str]
+    added_columns: Set[str]
+    removed_columns: Set[str]
+    added_edges: Set[Tuple[str, str, EdgeType]]
+    removed_edges: Set[Tuple[str, str, EdgeType]]
+
+    @property
+    def changed(self) -> bool:
+        return any(self)
+
+
+def _lineage_keys(
+    lineage: Union[SQLLineageHolder, LineageSnapshot],
+) -> Tuple[Set[NodeKey], Set[EdgeKey]]:
+    if isinstance(lineage, LineageSnapshot):
+        keys = [(lineage.kind(i), lineage.name(i)) for i in range(lineage.node_count)]
+        return set(keys), {
+            (keys[src], keys[tgt], edge_type.value)
+            for src, tgt, edge_type in lineage.edges()
+        }
+    else:
+        graph = lineage.graph
+        return {(object_kind(node), str(node)) for node in graph.nodes}, {
+            (
+                (object_kind(src), str(src)),
+                (object_kind(tgt), str(tgt)),
+                attr["type"].value,
+            )
+            for src, tgt, attr in graph.edges(data=True)
+        }
+
+
+def _names(keys: Set[NodeKey], *kinds: int) -> Set[str]:
+    return {name for kind, name in keys if kind in kinds}
+
+
+def _edges(keys: Set[EdgeKey]) -> Set[Tuple[str, str, EdgeType]]:
+    return {(src[1], tgt[1], EdgeType(edge_type)) for src, tgt, edge_type in keys}
+
+
+def lineage_diff(
+    old: Union[SQLLineageHolder, LineageSnapshot],
+    new: Union[SQLLineageHolder, LineageSnapshot],
+) -> LineageDiff:
+    """
+    compare two lineage results, each being either a :class:`sqllineage.core.holders.SQLLineageHolder` or an opened
+    :class:`sqllineage.snapshot.LineageSnapshot`.
+    """
+    old_nodes, old_edges = _lineage_keys(old)
+    new_nodes, new_edges = _lineage_keys(new)
+    added_nodes, removed_nodes = new_nodes - old_nodes, old_nodes - new_nodes
+    return LineageDiff(
+        _names(added_nodes, OBJECT_TABLE, OBJECT_PATH),
+        _names(removed_nodes, OBJECT_TABLE, OBJECT_PATH),
+        _names(added_nodes, OBJECT_COLUMN),
+        _names(removed_nodes, OBJECT_COLUMN),
+        _edges(new_edges - old_edges),
+        _edges(old_edges - new_edges),
+    )
@@ -6,18 +6,21 @@ the app behind a real production server like gunicorn or uwsgi, as app is wsgi c
 A simple gunicorn example: gunicorn sqllineage.drawing:app
 """
 
+import hashlib
 import json
 import logging
 import mimetypes
 import os
+import threading
 from argparse import Namespace
+from collections import OrderedDict
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, Callable, Dict, List
-from urllib.parse import urlencode
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+from urllib.parse import parse_qsl, urlencode
 from wsgiref.simple_server import make_server
 
-from sqllineage import DATA_FOLDER, DEFAULT_HOST, DEFAULT_PORT, STATIC_FOLDER
+from sqllineage import DATA_FOLDER, DEFAULT_HOST, DEFAULT_PORT, STATIC_FOLDER, VERSION
 from sqllineage.exceptions import SQLLineageException
 from sqllineage.utils.constant import LineageLevel
 from sqllineage.utils.helpers import extract_sql_from_args
@@ -25,9 +28,65 @@ from sqllineage.utils.helpers import extract_sql_from_args
 logger = logging.getLogger(__name__)
 
 
+class ETagResponse(NamedTuple):
+    """
+    JSON response identified by etag, which a route returns instead of dict to support revalidation. render is only
+    called when the etag doesn't match If-None-Match of the request. Otherwise GET is responded with 304 Not Modified
+    and other methods with 412 Precondition Failed, as RFC 9110 section 13.1.2 requires.
+    """
+
+    etag: str
+    render: Callable[[], bytes]
+
+
+class ResponseCache:
+    def __init__(
+        self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        A thread safe LRU cache of encoded responses, evicting the least recently used ones when exceeding either
+        max_entries or max_bytes in total.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = body
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
 class SQLLineageApp:
     def __init__(self) -> None:
-        self.routes: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        self.routes: Dict[
+            str, Callable[[Dict[str, Any]], Union[Dict[str, Any], ETagResponse]]
+        ] = {}
 
     def route(self, path: str):
         def wrapper(handler):
@@ -41,7 +100,11 @@ class SQLLineageApp:
         request_method = environ["REQUEST_METHOD"]
         path_info = environ["PATH_INFO"]
         try:
-            if request_method == "GET":
+            if request_method == "GET" and path_info in self.routes:
+                # route is also served by GET with payload in querystring, so that it can be revalidated
+                payload = dict(parse_qsl(environ.get("QUERY_STRING", "")))
+                return self.handle_route(start_response, environ, payload)
+            elif request_method == "GET":
                 mimetype = "text/html; charset=utf-8"
                 if path_info == "/":
                     static_fname = str(static_folder.joinpath(Path("index.html")))
@@ -68,8 +131,7 @@ class SQLLineageApp:
                     request_body_size = int(environ["CONTENT_LENGTH"])
                     request_body = environ["wsgi.input"].read(request_body_size)
                     payload = json.loads(request_body)
-                    data = self.routes[path_info](payload)
-                    return self.handle_200_json(start_response, data)
+                    return self.handle_route(start_response, environ, payload)
                 else:
                     return self.handle_404(start_response)
             elif request_method == "OPTIONS":
@@ -80,9 +142,9 @@ class SQLLineageApp:
                             ("Access-Control-Allow-Origin", "*"),
                             (
                                 "Access-Control-Allow-Headers",
-                                "Content-Type",
+                                "Content-Type, If-None-Match",
                             ),
-                            ("Access-Control-Allow-Methods", "POST"),
+                            ("Access-Control-Allow-Methods", "GET, POST"),
                         ],
                     )
                     return []
@@ -95,6 +157,17 @@ class SQLLineageApp:
         except SQLLineageException as e:
             return self.handle_400(start_response, str(e))
 
+    def handle_route(self, start_response, environ, payload) -> List[bytes]:
+        data = self.routes[environ["PATH_INFO"]](payload)
+        if isinstance(data, ETagResponse):
+            return self.handle_etag_response(
+                start_response,
+                data,
+                environ.get("HTTP_IF_NONE_MATCH"),
+                environ["REQUEST_METHOD"],
+            )
+        return self.handle_200_json(start_response, data)
+
     @staticmethod
     def handle_200_text(start_response, mimetype, text) -> List[bytes]:
         status_code = HTTPStatus.OK
@@ -106,6 +179,35 @@ class SQLLineageApp:
     def handle_200_json(self, start_response, data) -> List[bytes]:
         return self.handle_json_response(start_response, HTTPStatus.OK, data)
 
+    @staticmethod
+    def handle_etag_response(
+        start_response,
+        response: ETagResponse,
+        if_none_match: Optional[str],
+        request_method: str = "GET",
+    ) -> List[bytes]:
+        etags = [etag.strip() for etag in (if_none_match or "").split(",")]
+        headers = [
+            ("ETag", response.etag),
+            ("Access-Control-Allow-Origin", "*"),
+            ("Access-Control-Expose-Headers", "ETag"),
+        ]
+        if "*" in etags or response.etag in etags or f"W/{response.etag}" in etags:
+            status_code = (
+                HTTPStatus.NOT_MODIFIED
+                if request_method in ("GET", "HEAD")
+                else HTTPStatus.PRECONDITION_FAILED
+            )
+            start_response(f"{status_code.value} {status_code.phrase}", headers)
+            return []
+        body = response.render()
+        status_code = HTTPStatus.OK
+        start_response(
+            f"{status_code.value} {status_code.phrase}",
+            [("Content-type", "application/json")] + headers,
+        )
+        return [body]
+
     def handle_400(self, start_response, message) -> List[bytes]:
         return self.handle_client_error_response(
             start_response, HTTPStatus.BAD_REQUEST, message
@@ -142,22 +244,33 @@ class SQLLineageApp:
 
 
 app = SQLLineageApp()
+lineage_cache = ResponseCache()
 
 
 @app.route("/lineage")
 def lineage(payload):
-    # this is to avoid circular import
-    from sqllineage.runner import LineageRunner
-
     req_args = Namespace(**payload)
     sql = extract_sql_from_args(req_args)
-    lr = LineageRunner(sql, verbose=True)
-    data = {
-        "verbose": str(lr),
-        "dag": lr.to_cytoscape(),
-        "column": lr.to_cytoscape(LineageLevel.COLUMN),
-    }
-    return data
+    # lineage result depends on nothing but SQL and the version of sqllineage
+    key = hashlib.sha256(f"{VERSION}\0{sql}".encode("utf-8")).hexdigest()
+
+    def render() -> bytes:
+        body = lineage_cache.get(key)
+        if body is None:
+            # this is to avoid circular import
+            from sqllineage.runner import LineageRunner
+
+            lr = LineageRunner(sql, verbose=True)
+            data = {
+                "verbose": str(lr),
+                "dag": lr.to_cytoscape(),
+                "column": lr.to_cytoscape(LineageLevel.COLUMN),
+            }
+            body = json.dumps(data).encode("utf-8")
+            lineage_cache.put(key, body)
+        return body
+
+    return ETagResponse(f'"{key}"', render)
 
 
 @app.route("/script")
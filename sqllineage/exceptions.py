@@ -1,2 +1,6 @@
 class SQLLineageException(Exception):
     """Base Exception for SQLLineage"""
+
+
+class SQLLineageTimeoutException(SQLLineageException):
+    """Raised when analyzing a statement runs past its deadline"""
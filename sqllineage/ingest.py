@@ -0,0 +1,188 @@
+"""
+Query log ingestion. Warehouse query logs are dominated by a limited number of query shapes executed over and over with
+different literals, so each query is normalized and fingerprinted, and only the first query of each fingerprint gets
+analyzed. The lineage result is then fanned out to every record sharing that fingerprint.
+"""
+
+import csv
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from sqlparse import tokens as T
+from sqlparse.lexer import tokenize
+
+from sqllineage.core.models import Table, TableMetadata
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import AnalysisLimits, LineageRunner
+
+PLACEHOLDER = "?"
+# in (?, ?, ?) -> in (?)
+IN_LIST_REGEX = re.compile(r"\bin ?\((?:\?, )*\?\)")
+# values (?, ?), (?, ?) -> values (?, ?)
+REPEATED_ROWS_REGEX = re.compile(r"(\((?:\?, )*\?\))(?:, \1)+")
+# string literals following these keywords are read from or written to as Path, e.g. INSERT OVERWRITE DIRECTORY 'path'
+PATH_KEYWORDS = {"DIRECTORY", "LOCATION", "INPATH", "FROM", "JOIN", "INTO", "TABLE"}
+# 'hdfs://...', 's3a://...', 'file:///...' or '/absolute/path'
+URI_LITERAL_REGEX = re.compile(r"^'([a-z][a-z0-9+.-]*://|/)", re.IGNORECASE)
+
+
+class QueryLineage(NamedTuple):
+    """
+    table lineage of a distinct query shape
+    """
+
+    source_tables: List[Table]
+    target_tables: List[Table]
+    intermediate_tables: List[Table]
+    warnings: List[str]
+    error: Optional[str] = None
+
+
+class IngestedQuery(NamedTuple):
+    """
+    a query log record together with its fingerprint and lineage, the lineage object is shared among records of the
+    same fingerprint.
+    """
+
+    record: Dict[str, Any]
+    fingerprint: str
+    lineage: QueryLineage
+
+
+def normalize_query(sql: str) -> str:
+    """
+    normalize a query by replacing literals with placeholder, collapsing IN-list and VALUES rows, removing comments,
+    and normalizing whitespace and case. String literals used as path, e.g. INSERT OVERWRITE DIRECTORY 'path' or any
+    literal looking like a URI, are kept as is.
+    """
+    parts = []
+    previous = ""
+    for ttype, value in tokenize(sql):
+        if ttype in T.Comment:
+            parts.append(" ")
+            continue
+        elif ttype in T.Whitespace:
+            parts.append(" ")
+            continue
+        elif ttype in T.String.Single and _is_path_literal(value, previous):
+            # path literals are datasets in lineage, different paths must not share a fingerprint
+            parts.append(value)
+        elif ttype in T.Number or ttype in T.String.Single:
+            parts.append(PLACEHOLDER)
+        elif ttype in T.Punctuation and value == ",":
+            parts.append(", ")
+        else:
+            parts.append(value.lower())
+        previous = value.upper()
+    normalized = " ".join("".join(parts).split())
+    normalized = normalized.replace("( ", "(").replace(" )", ")").replace(" ,", ",")
+    normalized = IN_LIST_REGEX.sub("in (?)", normalized)
+    normalized = REPEATED_ROWS_REGEX.sub(r"\1", normalized)
+    return normalized.rstrip("; ")
+
+
+def _is_path_literal(value: str, previous: str) -> bool:
+    return (
+        previous in PATH_KEYWORDS
+        or previous.endswith("JOIN")
+        or URI_LITERAL_REGEX.match(value) is not None
+    )
+
+
+def fingerprint_query(sql: str) -> str:
+    """
+    the hex digest of the normalized query
+    """
+    return hashlib.sha256(normalize_query(sql).encode("utf-8")).hexdigest()
+
+
+def read_query_log(
+    path: str, query_column: str = "query", fmt: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    read records from a query log file, either JSON Lines or CSV with a header row.
+
+    :param path: path of the query log file
+    :param query_column: the field holding SQL text
+    :param fmt: "jsonl" or "csv", inferred from file extension when not specified
+    """
+    if fmt is None:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    if fmt not in ("jsonl", "csv"):
+        raise SQLLineageException("Unsupported query log format %s" % fmt)
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            records: Iterable[Dict[str, Any]] = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        for i, record in enumerate(records, 1):
+            if not isinstance(record.get(query_column), str):
+                raise SQLLineageException(
+                    "Record #%d of %s has no %s field" % (i, path, query_column)
+                )
+            yield record
+
+
+class QueryLogIngestor:
+    def __init__(
+        self,
+        query_column: str = "query",
+        table_metadata: Optional[TableMetadata] = None,
+        limits: Optional[AnalysisLimits] = None,
+    ):
+        """
+        Analyze query log records with fingerprint deduplication. The ingestor remembers fingerprints across calls,
+        so multiple log files can be fed to the same ingestor.
+
+        :param query_column: the field holding SQL text
+        :param table_metadata: metadata passed to :class:`sqllineage.runner.LineageRunner`
+        :param limits: limits passed to :class:`sqllineage.runner.LineageRunner`
+        """
+        self._query_column = query_column
+        self._metadata = table_metadata
+        self._limits = limits
+        self._lineages: Dict[str, QueryLineage] = {}
+        self.records_count = 0
+
+    @property
+    def fingerprints_count(self) -> int:
+        """
+        number of distinct fingerprints analyzed so far
+        """
+        return len(self._lineages)
+
+    def ingest(self, records: Iterable[Dict[str, Any]]) -> Iterator[IngestedQuery]:
+        """
+        yield each record with its lineage, in the order of input records.
+        """
+        for record in records:
+            sql = record[self._query_column]
+            fingerprint = fingerprint_query(sql)
+            lineage = self._lineages.get(fingerprint)
+            if lineage is None:
+                lineage = self._lineages[fingerprint] = self._analyze(sql)
+            self.records_count += 1
+            yield IngestedQuery(record, fingerprint, lineage)
+
+    def ingest_file(
+        self, path: str, fmt: Optional[str] = None
+    ) -> Iterator[IngestedQuery]:
+        """
+        same as ingest, reading records from a query log file by :func:`read_query_log`.
+        """
+        return self.ingest(read_query_log(path, self._query_column, fmt))
+
+    def _analyze(self, sql: str) -> QueryLineage:
+        runner = LineageRunner(sql, table_metadata=self._metadata, limits=self._limits)
+        try:
+            return QueryLineage(
+                runner.source_tables,
+                runner.target_tables,
+                runner.intermediate_tables,
+                runner.warnings,
+            )
+        except Exception as e:  # noqa: B902
+            # sqlparse may fail in any way on a malformed query, which should not stop the whole log from being ingested
+            return QueryLineage([], [], [], [], f"{type(e).__name__}: {e}")
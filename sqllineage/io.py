@@ -1,9 +1,10 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, TYPE_CHECKING
 
-from networkx import DiGraph
+if TYPE_CHECKING:
+    from networkx import DiGraph
 
 
-def to_cytoscape(graph: DiGraph, compound=False) -> List[Dict[str, Dict[str, Any]]]:
+def to_cytoscape(graph: "DiGraph", compound=False) -> List[Dict[str, Dict[str, Any]]]:
     """
     compound nodes is used to group nodes together to their parent.
     See https://js.cytoscape.org/#notation/compound-nodes for reference.
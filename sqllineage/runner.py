@@ -1,15 +1,41 @@
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import sqlparse
+from sqlparse.engine import grouping
 from sqlparse.sql import Statement
 
 from sqllineage.core import LineageAnalyzer
-from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
 from sqllineage.core.models import Column, Table, TableMetadata
-from sqllineage.drawing import draw_lineage_graph
+from sqllineage.exceptions import SQLLineageTimeoutException
 from sqllineage.io import to_cytoscape
 from sqllineage.utils.constant import LineageLevel
+from sqllineage.utils.helpers import is_non_lineage_statement
+from sqllineage.utils.schemaFetcher import PrefetchedSchemaFetcher, SchemaFetcher
+from sqllineage.utils.sqlparse import (
+    get_subquery_depth,
+    remove_values_payload,
+    split_statements,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +44,10 @@ def lazy_method(func):
     def wrapper(*args, **kwargs):
         self = args[0]
         if not self._evaluated:
-            self._eval()
+            # threads sharing one runner evaluate it once, the others wait for the result
+            with self._eval_lock:
+                if not self._evaluated:
+                    self._eval()
         return func(*args, **kwargs)
 
     return wrapper
@@ -28,6 +57,398 @@ def lazy_property(func):
     return property(lazy_method(func))
 
 
+class AnalysisLimits(NamedTuple):
+    """
+    Per statement budgets for :class:`LineageRunner`, None stands for no limit.
+
+    A statement longer than max_statement_length or nested deeper than max_subquery_depth is skipped before parsing.
+    A statement with more tokens than max_token_count is analyzed for table lineage only, without resolving columns.
+    For max_seconds, the statement is skipped if grouping or analysis can't finish within it, or only keeps table
+    lineage if it finishes but takes longer.
+
+    With multiple workers, max_seconds is also enforced as a hard timeout in worker process, covering the sqlparse
+    grouping as well, and max_memory caps the address space of each worker process in bytes (Unix only).
+    """
+
+    max_statement_length: Optional[int] = None
+    max_token_count: Optional[int] = None
+    max_subquery_depth: Optional[int] = None
+    max_seconds: Optional[float] = None
+    max_memory: Optional[int] = None
+
+
+class PhaseMemory(NamedTuple):
+    """
+    Memory usage of a phase in :class:`LineageRunner` evaluation, in bytes. peak is the highest traced memory during
+    the phase above where it starts, retained is the net allocation still alive when the phase ends.
+    retained_by_type breaks retained down by the package allocating it: "sqlparse" for tokens, "sqllineage" for
+    Table/Column models and lineage holders, "networkx" for graph dict storage, and "other".
+    """
+
+    phase: str
+    peak: int
+    retained: int
+    retained_by_type: Dict[str, int]
+
+
+MEMORY_CATEGORIES = ("sqlparse", "sqllineage", "networkx")
+
+
+class _MemoryProfiler:
+    def __init__(self) -> None:
+        self.phases: List[PhaseMemory] = []
+
+    @staticmethod
+    def _category(filename: str) -> str:
+        for category in MEMORY_CATEGORIES:
+            if f"{os.sep}{category}{os.sep}" in filename:
+                return category
+        return "other"
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            if hasattr(tracemalloc, "reset_peak"):
+                # reset_peak is only available since Python 3.9
+                tracemalloc.reset_peak()
+            before = self._snapshot()
+            baseline, _ = tracemalloc.get_traced_memory()
+            yield
+            _, peak = tracemalloc.get_traced_memory()
+            retained_by_type = {
+                category: 0 for category in MEMORY_CATEGORIES + ("other",)
+            }
+            for stat in self._snapshot().compare_to(before, "filename"):
+                category = self._category(stat.traceback[0].filename)
+                retained_by_type[category] += stat.size_diff
+            self.phases.append(
+                PhaseMemory(
+                    name,
+                    max(peak - baseline, 0),
+                    sum(retained_by_type.values()),
+                    retained_by_type,
+                )
+            )
+        finally:
+            if started:
+                tracemalloc.stop()
+
+
+class _PreparedStatement(NamedTuple):
+    """
+    a statement grouped under the limits, stmt being None when it's skipped
+    """
+
+    stmt: Optional[Statement]
+    column_lineage: bool
+    warnings: List[str]
+    start: float = 0
+    deadline: Optional[float] = None
+
+
+def _prepare_statement(stmt: Statement, limits: AnalysisLimits) -> _PreparedStatement:
+    """
+    check the limits on a statement with flat token list, and group it unless it's skipped.
+    """
+    if is_non_lineage_statement(stmt.value):
+        # statements like SET/USE/GRANT produce no lineage, no need to build the token tree for them
+        return _PreparedStatement(None, True, [])
+    length = len(stmt.value)
+    if limits.max_statement_length is not None and length > limits.max_statement_length:
+        return _PreparedStatement(
+            None,
+            True,
+            [
+                f"skipped, length {length} exceeds max_statement_length {limits.max_statement_length}"
+            ],
+        )
+    if limits.max_subquery_depth is not None:
+        depth = get_subquery_depth(stmt)
+        if depth > limits.max_subquery_depth:
+            return _PreparedStatement(
+                None,
+                True,
+                [
+                    f"skipped, subquery depth {depth} exceeds max_subquery_depth {limits.max_subquery_depth}"
+                ],
+            )
+    warnings = []
+    # statement is not grouped yet, so this is the flat token count, known before paying for grouping
+    token_count = len(stmt.tokens)
+    column_lineage = True
+    if limits.max_token_count is not None and token_count > limits.max_token_count:
+        # column lineage is what makes analysis explode, resolve only the tables
+        column_lineage = False
+        warnings.append(
+            f"table lineage only, token count {token_count} exceeds max_token_count {limits.max_token_count}"
+        )
+    start = time.monotonic()
+    deadline = start + limits.max_seconds if limits.max_seconds is not None else None
+    stmt = grouping.group(remove_values_payload(stmt))
+    if deadline is not None and time.monotonic() > deadline:
+        # grouping can't be interrupted in process, checked once it returns
+        return _PreparedStatement(
+            None, True, [f"skipped, analysis exceeds max_seconds {limits.max_seconds}"]
+        )
+    return _PreparedStatement(stmt, column_lineage, warnings, start, deadline)
+
+
+def _analyze_prepared_statement(
+    prepared: _PreparedStatement, metadata: TableMetadata, limits: AnalysisLimits
+) -> Tuple[StatementLineageHolder, List[str]]:
+    if prepared.stmt is None:
+        return StatementLineageHolder(), prepared.warnings
+    warnings = list(prepared.warnings)
+    try:
+        holder = LineageAnalyzer().analyze(
+            prepared.stmt, metadata, prepared.deadline, prepared.column_lineage
+        )
+    except SQLLineageTimeoutException:
+        return StatementLineageHolder(), [
+            f"skipped, analysis exceeds max_seconds {limits.max_seconds}"
+        ]
+    deadline = prepared.deadline
+    if deadline is not None and time.monotonic() > deadline and prepared.column_lineage:
+        warnings.append(
+            f"table lineage only, analysis takes {time.monotonic() - prepared.start:.3f}s, "
+            f"exceeds max_seconds {limits.max_seconds}"
+        )
+        holder.graph.remove_nodes_from(
+            [n for n in holder.graph.nodes if isinstance(n, Column)]
+        )
+    return holder, warnings
+
+
+def _analyze_statement(
+    stmt: Statement, metadata: TableMetadata, limits: AnalysisLimits
+) -> Tuple[StatementLineageHolder, List[str]]:
+    """
+    analyze a statement with flat token list under the limits, return the lineage together with the warnings of
+    whichever limit is hit.
+    """
+    return _analyze_prepared_statement(
+        _prepare_statement(stmt, limits), metadata, limits
+    )
+
+
+def _analyze_statement_sql(
+    sql: str, metadata: TableMetadata, limits: AnalysisLimits
+) -> Tuple[StatementLineageHolder, List[str]]:
+    """
+    same as _analyze_statement, taking statement string instead. Passing string to worker process is much cheaper
+    than pickling the token list, and it's a single statement for lexing here.
+    """
+    for stmt in split_statements(sql):
+        if stmt.token_first(skip_cm=True):
+            return _analyze_statement(stmt, metadata, limits)
+    return StatementLineageHolder(), []
+
+
+class _SchemaPrefetch:
+    def __init__(
+        self, stmts: List[Statement], metadata: TableMetadata, limits: AnalysisLimits
+    ):
+        """
+        Analysis with the schemas it needs fetched in one bulk call, shared by LineageRunner with prefetch_schema
+        and AsyncLineageRunner. Statements are grouped once, and a table lineage only pass, cheap as no column is
+        resolved, collects the tables whose schema column resolution could ask for, i.e. tables read by queries with
+        wildcard, or with unqualified column and more than one table.
+        Fetch schemas of tables, and then call analyze with them for the one full analysis.
+        """
+        self._metadata = metadata
+        self._limits = limits
+        self._prepared = [_prepare_statement(stmt, limits) for stmt in stmts]
+        tables: Set[str] = set()
+        for prepared in self._prepared:
+            if prepared.stmt is None or not prepared.column_lineage:
+                continue
+            try:
+                holder = LineageAnalyzer().analyze(
+                    prepared.stmt,
+                    metadata._replace(schema_fetcher=None),
+                    prepared.deadline,
+                    column_lineage=False,
+                )
+            except SQLLineageTimeoutException:
+                # it's skipped by the full analysis as well
+                continue
+            tables |= {metadata.table_fullname(str(table)) for table in holder.schema}
+        self.tables = sorted(tables)
+
+    def analyze(
+        self, schema_fetcher: SchemaFetcher
+    ) -> List[Tuple[StatementLineageHolder, List[str]]]:
+        """
+        the full analysis of statements, with schemas looked up from schema_fetcher
+        """
+        metadata = self._metadata._replace(schema_fetcher=schema_fetcher)
+        return [
+            _analyze_prepared_statement(prepared, metadata, self._limits)
+            for prepared in self._prepared
+        ]
+
+
+# statement progress shared by worker processes of a pool, set by _init_worker
+_statement_states: Any = None
+STATE_STARTED = 1
+STATE_DONE = 2
+
+
+def _init_worker(limits: AnalysisLimits, states: Any = None) -> None:
+    global _statement_states
+    _statement_states = states
+    if limits.max_memory is not None and sys.platform != "win32":
+        import resource
+
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (limits.max_memory, hard))
+
+
+def _raise_timeout(signum, frame):
+    raise SQLLineageTimeoutException("Analysis runs past deadline")
+
+
+def _analyze_statement_isolated(
+    sql: str, metadata: TableMetadata, limits: AnalysisLimits
+) -> Tuple[StatementLineageHolder, List[str]]:
+    """
+    same as _analyze_statement_sql, run in worker process. Whatever goes wrong with the statement, including
+    RecursionError, MemoryError and a hang in sqlparse grouping, is turned into a warning.
+    """
+    start = time.monotonic()
+    alarm = limits.max_seconds is not None and hasattr(signal, "setitimer")
+    try:
+        if alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            # zero would disarm the timer
+            signal.setitimer(signal.ITIMER_REAL, max(limits.max_seconds, 1e-6))  # type: ignore
+        return _analyze_statement_sql(sql, metadata, limits)
+    except SQLLineageTimeoutException:
+        return StatementLineageHolder(), [
+            f"skipped, analysis exceeds max_seconds {limits.max_seconds}"
+        ]
+    except Exception as e:  # noqa: B902
+        # catching everything is the point, so that one statement failing in any way doesn't fail the others
+        return StatementLineageHolder(), [
+            f"failed after {time.monotonic() - start:.3f}s, {type(e).__name__}: {e}"
+        ]
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _analyze_statements_isolated(
+    indexes: List[int], sqls: List[str], metadata: TableMetadata, limits: AnalysisLimits
+) -> List[Tuple[StatementLineageHolder, List[str]]]:
+    results = []
+    for i, sql in zip(indexes, sqls):
+        # progress tells the parent which statement a worker dies on
+        _statement_states[i] = STATE_STARTED
+        results.append(_analyze_statement_isolated(sql, metadata, limits))
+        _statement_states[i] = STATE_DONE
+    return results
+
+
+def _schedule_chunks(costs: List[int], workers: int) -> List[List[int]]:
+    """
+    group job indexes into chunks by estimated cost, largest first. A job costing more than the target chunk cost
+    forms a chunk by itself, smaller jobs are packed together up to the target. This way giant jobs are started
+    early instead of holding up the tail, while small jobs share the IPC round trip.
+    """
+    target = max(1, sum(costs) // (workers * 4))
+    chunks: List[List[int]] = []
+    chunk: List[int] = []
+    chunk_cost = 0
+    for i in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        if chunk and chunk_cost + costs[i] > target:
+            chunks.append(chunk)
+            chunk, chunk_cost = [], 0
+        chunk.append(i)
+        chunk_cost += costs[i]
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _analyze_statements_in_pool(
+    sqls: List[str], metadata: TableMetadata, limits: AnalysisLimits, workers: int
+) -> List[Tuple[StatementLineageHolder, List[str]]]:
+    """
+    analyze statements in a process pool, scheduled by statement length. When a worker process dies, e.g. killed for
+    running out of memory, the pool is broken. Statements being analyzed at that moment are retried one by one, each
+    in a new process, so that only the culprit fails, while the rest not done yet go to a fresh pool of the same size.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    states = multiprocessing.Array("b", len(sqls), lock=False)
+    results: Dict[int, Tuple[StatementLineageHolder, List[str]]] = {}
+    retries: List[int] = []
+    pending = list(range(len(sqls)))
+    while pending:
+        chunks = [
+            [pending[i] for i in chunk]
+            for chunk in _schedule_chunks([len(sqls[i]) for i in pending], workers)
+        ]
+        broken = []
+        with ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(limits, states)
+        ) as executor:
+            futures: List[
+                Tuple[List[int], Future[List[Tuple[StatementLineageHolder, List[str]]]]]
+            ] = [
+                (
+                    chunk,
+                    executor.submit(
+                        _analyze_statements_isolated,
+                        chunk,
+                        [sqls[i] for i in chunk],
+                        metadata,
+                        limits,
+                    ),
+                )
+                for chunk in chunks
+            ]
+            for chunk, future in futures:
+                try:
+                    results.update(zip(chunk, future.result()))
+                except (BrokenProcessPool, OSError):
+                    broken.extend(chunk)
+        # statements started but not done were running when the pool broke, the culprit among them
+        running = [i for i in broken if states[i] == STATE_STARTED]
+        if not running:
+            # no progress recorded, e.g. pool failed to start workers, isolate them all instead of looping
+            running = broken
+        retries.extend(running)
+        pending = sorted(set(broken) - set(running))
+        for i in pending:
+            states[i] = 0
+    for i in retries:
+        start = time.monotonic()
+        with ProcessPoolExecutor(
+            1, initializer=_init_worker, initargs=(limits, states)
+        ) as executor:
+            try:
+                results[i] = executor.submit(
+                    _analyze_statements_isolated, [i], [sqls[i]], metadata, limits
+                ).result()[0]
+            except (BrokenProcessPool, OSError) as e:
+                results[i] = StatementLineageHolder(), [
+                    f"failed after {time.monotonic() - start:.3f}s, worker process error {type(e).__name__}: {e}"
+                ]
+    return [results[i] for i in range(len(sqls))]
+
+
 class LineageRunner(object):
     def __init__(
         self,
@@ -36,6 +457,10 @@ class LineageRunner(object):
         encoding: Optional[str] = None,
         verbose: bool = False,
         draw_options: Optional[Dict[str, str]] = None,
+        limits: Optional[AnalysisLimits] = None,
+        workers: int = 1,
+        profile_memory: bool = False,
+        prefetch_schema: bool = False,
     ):
         """
         The entry point of SQLLineage after command line options are parsed.
@@ -43,14 +468,33 @@ class LineageRunner(object):
         :param sql: a string representation of SQL statements.
         :param encoding: the encoding for sql string
         :param verbose: verbose flag indicate whether statement-wise lineage result will be shown
+        :param limits: per statement budgets as defined by :class:`AnalysisLimits`
+        :param workers: number of processes to analyze statements in parallel. When set greater than 1, table_metadata
+            (including its schema fetcher) has to be picklable, and a statement failing analysis is reported in
+            warnings together with its error and timing, instead of raising exception.
+        :param profile_memory: trace memory of each evaluation phase with tracemalloc, reported by memory_profile.
+            Memory allocated in worker processes is not traced. As tracemalloc is process wide, profiling runners in
+            concurrent threads mixes up their allocations.
+        :param prefetch_schema: with schema fetcher in table_metadata, collect tables read by the statements in a
+            table lineage only pass, and fetch their schemas in one call to SchemaFetcher.get_schemas before
+            resolving columns. Worthwhile when each lookup is a round trip to remote catalog. It doesn't apply to
+            multiple workers. Either way, schemas are cached for the run.
+
+        LineageRunner can be used from multiple threads, see :ref:`thread safety <thread_safety>` for details.
         """
         self._encoding = encoding
         self._sql = sql
         self._verbose = verbose
         self._metadata = table_metadata or TableMetadata()
         self._draw_options = draw_options if draw_options else {}
+        self._limits = limits or AnalysisLimits()
+        self._workers = workers
+        self._profiler = _MemoryProfiler() if profile_memory else None
+        self._prefetch_schema = prefetch_schema
         self._evaluated = False
+        self._eval_lock = threading.Lock()
         self._stmt: List[Statement] = []
+        self._warnings: List[str] = []
 
     @lazy_method
     def __str__(self):
@@ -99,6 +543,8 @@ Target Tables:
         """
         to draw the lineage directed graph
         """
+        from sqllineage.drawing import draw_lineage_graph
+
         draw_options = self._draw_options
         if draw_options.get("f") is None:
             draw_options.pop("f", None)
@@ -117,30 +563,55 @@ Target Tables:
     @lazy_property
     def statements_parsed(self) -> List[Statement]:
         """
-        a list of :class:`sqlparse.sql.Statement`
+        a list of :class:`sqlparse.sql.Statement`. Statements producing no lineage (SET, USE, GRANT, etc.) are not
+        grouped, i.e. their tokens are left as a flat list, so are all the statements analyzed with multiple workers.
+        For INSERT ... VALUES, the literal rows are dropped from
+        the token tree, use `statements` to get the original text.
         """
         return self._stmt
 
+    @lazy_property
+    def statement_holders(self) -> List[StatementLineageHolder]:
+        """
+        a list of :class:`sqllineage.core.holders.StatementLineageHolder`, one for each statement in
+        statements_parsed, e.g. to be persisted or combined with lineage of other SQL later on
+        """
+        return list(self._stmt_holders)
+
+    @lazy_property
+    def warnings(self) -> List[str]:
+        """
+        a list of messages for statements that hit the limits, being skipped or degraded to table lineage only
+        """
+        return self._warnings
+
+    @lazy_property
+    def memory_profile(self) -> List[PhaseMemory]:
+        """
+        a list of :class:`PhaseMemory` for phases parse, analyze and merge, empty unless profile_memory is enabled
+        """
+        return self._profiler.phases if self._profiler else []
+
     @lazy_property
     def source_tables(self) -> List[Table]:
         """
         a list of source :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.source_tables, key=lambda x: str(x))
+        return list(self._source_tables)
 
     @lazy_property
     def target_tables(self) -> List[Table]:
         """
         a list of target :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.target_tables, key=lambda x: str(x))
+        return list(self._target_tables)
 
     @lazy_property
     def intermediate_tables(self) -> List[Table]:
         """
         a list of intermediate :class:`sqllineage.models.Table`
         """
-        return sorted(self._sql_holder.intermediate_tables, key=lambda x: str(x))
+        return list(self._intermediate_tables)
 
     @lazy_method
     def get_column_lineage(self, exclude_subquery=True) -> List[Tuple[Column, ...]]:
@@ -167,19 +638,71 @@ Target Tables:
         """
         print(str(self))
 
+    def _phase(self, name: str) -> ContextManager[None]:
+        return self._profiler.phase(name) if self._profiler else nullcontext()
+
     def _eval(self):
-        self._stmt = [
-            s
-            for s in sqlparse.parse(
-                # first apply sqlparser formatting just to get rid of comments, which cause
-                # inconsistencies in parsing output
-                sqlparse.format(self._sql.strip(), self._encoding, strip_comments=True),
-                self._encoding,
+        self._parse()
+        with self._phase("analyze"):
+            metadata = self._metadata
+            if metadata.schema_fetcher is not None:
+                # per run cache, so that each table is looked up once
+                metadata = metadata._replace(
+                    schema_fetcher=PrefetchedSchemaFetcher({}, metadata.schema_fetcher)
+                )
+            if self._workers > 1 and len(self._stmt) > 1:
+                # statements are analyzed independently, only merging them into SQLLineageHolder has to be in order
+                results = _analyze_statements_in_pool(
+                    [stmt.value for stmt in self._stmt],
+                    metadata,
+                    self._limits,
+                    self._workers,
+                )
+            elif self._prefetch_schema and self._metadata.schema_fetcher is not None:
+                fetcher = self._metadata.schema_fetcher
+                prefetch = _SchemaPrefetch(self._stmt, self._metadata, self._limits)
+                schemas = (
+                    fetcher.get_schemas(
+                        prefetch.tables, self._metadata.platform, self._metadata.account
+                    )
+                    if prefetch.tables
+                    else {}
+                )
+                # tables left out of the result still fall back to point lookup
+                results = prefetch.analyze(PrefetchedSchemaFetcher(schemas, fetcher))
+            else:
+                results = [
+                    _analyze_statement(stmt, metadata, self._limits)
+                    for stmt in self._stmt
+                ]
+        self._merge(results)
+
+    def _parse(self) -> List[Statement]:
+        with self._phase("parse"):
+            self._stmt = [
+                s
+                # comments are stripped as they cause inconsistencies in parsing output
+                for s in split_statements(
+                    self._sql.strip(), self._encoding, strip_comments=True
+                )
+                if s.token_first(skip_cm=True)
+            ]
+        return self._stmt
+
+    def _merge(self, results: List[Tuple[StatementLineageHolder, List[str]]]) -> None:
+        self._stmt_holders = []
+        self._warnings = []
+        for i, (holder, warnings) in enumerate(results):
+            for warning in warnings:
+                logger.warning("Statement #%d: %s", i + 1, warning)
+                self._warnings.append(f"Statement #{i + 1}: {warning}")
+            self._stmt_holders.append(holder)
+        with self._phase("merge"):
+            self._sql_holder = SQLLineageHolder.of(*self._stmt_holders)
+            # sorted once here, properties hand out copies
+            self._source_tables = sorted(self._sql_holder.source_tables, key=str)
+            self._target_tables = sorted(self._sql_holder.target_tables, key=str)
+            self._intermediate_tables = sorted(
+                self._sql_holder.intermediate_tables, key=str
             )
-            if s.token_first(skip_cm=True)
-        ]
-        self._stmt_holders = [
-            LineageAnalyzer().analyze(stmt, self._metadata) for stmt in self._stmt
-        ]
-        self._sql_holder = SQLLineageHolder.of(*self._stmt_holders)
         self._evaluated = True
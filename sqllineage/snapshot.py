@@ -0,0 +1,273 @@
+"""
+Lineage snapshot is a binary file holding the combined lineage graph of SQLLineageHolder, which can be opened with mmap
+and queried directly, without re-parsing SQL or rebuilding networkx objects.
+
+File layout, all integers in native byte order, each array padded to 8 bytes:
+    header: magic, version, byte order mark, node count, edge count, string table size
+    kinds: uint8[node count], object kind as defined in sqllineage.core.serialization
+    tags: uint8[node count], node tag bitfield as defined in sqllineage.core.serialization
+    roles: uint8[node count], whether a table is source, target or intermediate table
+    name offsets: uint32[node count + 1], node i's name is strings[offsets[i]:offsets[i + 1]]
+    sorted ids: uint32[node count], node ids sorted by name, for binary search
+    out offsets, out targets, out edge types: CSR adjacency of successors
+    in offsets, in sources, in edge types: CSR adjacency of predecessors
+    strings: utf-8 encoded node names
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, Optional, Tuple
+
+from sqllineage.core.holders import SQLLineageHolder
+from sqllineage.core.serialization import TAGS, encode_tags, object_kind
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.utils.constant import EdgeType
+
+MAGIC = b"SQLLSNAP"
+VERSION = 1
+BYTE_ORDER_MARK = 0x01020304
+HEADER = struct.Struct("=8sIIIIQ")
+
+ROLE_SOURCE = 1
+ROLE_TARGET = 2
+ROLE_INTERMEDIATE = 4
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+def _write_array(f: BinaryIO, arr: "array[int]") -> None:
+    data = arr.tobytes()
+    f.write(data)
+    f.write(b"\0" * _padding(len(data)))
+
+
+def _file_size(n_nodes: int, n_edges: int, strings_size: int) -> int:
+    """
+    the size of a snapshot file as laid out by save_snapshot
+    """
+    arrays = [n_nodes] * 3 + [4 * (n_nodes + 1), 4 * n_nodes]
+    arrays += [4 * (n_nodes + 1), 4 * n_edges, n_edges] * 2
+    return HEADER.size + sum(size + _padding(size) for size in arrays) + strings_size
+
+
+def _csr(
+    n: int, edges: List[Tuple[int, int, int]]
+) -> Tuple["array[int]", "array[int]", "array[int]"]:
+    offsets = array("I", [0] * (n + 1))
+    for src, _, _ in edges:
+        offsets[src + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    cursor = array("I", offsets[:-1])
+    neighbors = array("I", [0] * len(edges))
+    edge_types = array("B", [0] * len(edges))
+    for src, tgt, edge_type in edges:
+        neighbors[cursor[src]] = tgt
+        edge_types[cursor[src]] = edge_type
+        cursor[src] += 1
+    return offsets, neighbors, edge_types
+
+
+def save_snapshot(holder: SQLLineageHolder, path: str) -> None:
+    """
+    save the combined lineage graph of :class:`sqllineage.core.holders.SQLLineageHolder` into a snapshot file.
+    """
+    graph = holder.graph
+    nodes = list(graph.nodes)
+    index: Dict[Any, int] = {node: i for i, node in enumerate(nodes)}
+    roles = array("B", [0] * len(nodes))
+    for tables, role in (
+        (holder.source_tables, ROLE_SOURCE),
+        (holder.target_tables, ROLE_TARGET),
+        (holder.intermediate_tables, ROLE_INTERMEDIATE),
+    ):
+        for table in tables:
+            roles[index[table]] |= role
+    kinds = array("B", [object_kind(node) for node in nodes])
+    tags = array("B", [encode_tags(attr) for _, attr in graph.nodes(data=True)])
+    names = [str(node).encode("utf-8") for node in nodes]
+    name_offsets = array("I", [0] * (len(nodes) + 1))
+    for i, name in enumerate(names):
+        name_offsets[i + 1] = name_offsets[i] + len(name)
+    sorted_ids = array("I", sorted(range(len(nodes)), key=lambda i: names[i]))
+    edges = [
+        (index[src], index[tgt], attr["type"].value)
+        for src, tgt, attr in graph.edges(data=True)
+    ]
+    strings = b"".join(names)
+    with open(path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, BYTE_ORDER_MARK, len(nodes), len(edges), len(strings)
+            )
+        )
+        for arr in (kinds, tags, roles, name_offsets, sorted_ids):
+            _write_array(f, arr)
+        for arr in _csr(len(nodes), edges):
+            _write_array(f, arr)
+        for arr in _csr(len(nodes), [(tgt, src, t) for src, tgt, t in edges]):
+            _write_array(f, arr)
+        f.write(strings)
+
+
+class LineageSnapshot:
+    def __init__(self, path: str):
+        """
+        Memory-mapped view of a snapshot file saved by :func:`save_snapshot`. Node names and adjacency are read from
+        the file on demand. Nodes are referred to by their integer id within the snapshot.
+
+        :param path: path of the snapshot file
+        """
+        with open(path, "rb") as f:
+            # header is validated before mapping, mmap fails on empty file and unpack on a short one
+            header = f.read(HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+        if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+            raise SQLLineageException("%s is not a lineage snapshot file" % path)
+        _, version, bom, n_nodes, n_edges, strings_size = HEADER.unpack(header)
+        if version != VERSION or bom != BYTE_ORDER_MARK:
+            raise SQLLineageException(
+                "Incompatible snapshot file %s, version %s" % (path, version)
+            )
+        if size != _file_size(n_nodes, n_edges, strings_size):
+            raise SQLLineageException("Truncated or corrupted snapshot file %s" % path)
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        self._views: List[memoryview] = [buffer]
+        self._buffer = buffer
+        self._offset = HEADER.size
+        self.node_count = n_nodes
+        self.edge_count = n_edges
+        self._kinds = self._take("B", n_nodes)
+        self._tags = self._take("B", n_nodes)
+        self._roles = self._take("B", n_nodes)
+        self._name_offsets = self._take("I", n_nodes + 1)
+        self._sorted_ids = self._take("I", n_nodes)
+        self._out = (
+            self._take("I", n_nodes + 1),
+            self._take("I", n_edges),
+            self._take("B", n_edges),
+        )
+        self._in = (
+            self._take("I", n_nodes + 1),
+            self._take("I", n_edges),
+            self._take("B", n_edges),
+        )
+        start, end = self._offset, self._offset + strings_size
+        self._strings = buffer[start:end]
+        self._views.append(self._strings)
+
+    def _take(self, fmt: Literal["B", "I"], count: int) -> memoryview:
+        size = struct.calcsize(fmt) * count
+        start, end = self._offset, self._offset + size
+        raw = self._buffer[start:end]
+        view: memoryview = raw.cast(fmt)
+        self._views.extend([raw, view])
+        self._offset += size + _padding(size)
+        return view
+
+    def close(self) -> None:
+        # memoryview into mmap has to be released before mmap can be closed
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def name(self, node: int) -> str:
+        """
+        the name of the node, same as str() of the original Table/Column/SubQuery object
+        """
+        return self._raw_name(node).decode("utf-8")
+
+    def kind(self, node: int) -> int:
+        """
+        the object kind of the node, as defined by OBJECT_* in sqllineage.core.serialization
+        """
+        return int(self._kinds[node])
+
+    def has_tag(self, node: int, tag: str) -> bool:
+        return bool(self._tags[node] & (1 << TAGS.index(tag)))
+
+    def find(self, name: str, kind: Optional[int] = None) -> List[int]:
+        """
+        find node ids by name with binary search, optionally filtered by object kind
+        """
+        target = name.encode("utf-8")
+        lo, hi = 0, self.node_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._raw_name(self._sorted_ids[mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        result = []
+        while lo < self.node_count and self._raw_name(self._sorted_ids[lo]) == target:
+            node = self._sorted_ids[lo]
+            if kind is None or self.kind(node) == kind:
+                result.append(node)
+            lo += 1
+        return result
+
+    def successors(self, node: int, edge_type: Optional[EdgeType] = None) -> List[int]:
+        return self._neighbors(self._out, node, edge_type)
+
+    def predecessors(
+        self, node: int, edge_type: Optional[EdgeType] = None
+    ) -> List[int]:
+        return self._neighbors(self._in, node, edge_type)
+
+    def edges(self) -> Iterator[Tuple[int, int, EdgeType]]:
+        """
+        all the edges as (source node, target node, edge type)
+        """
+        offsets, neighbors, edge_types = self._out
+        for node in range(self.node_count):
+            for i in range(offsets[node], offsets[node + 1]):
+                yield node, neighbors[i], EdgeType(edge_types[i])
+
+    @property
+    def source_tables(self) -> List[str]:
+        return self._tables_with_role(ROLE_SOURCE)
+
+    @property
+    def target_tables(self) -> List[str]:
+        return self._tables_with_role(ROLE_TARGET)
+
+    @property
+    def intermediate_tables(self) -> List[str]:
+        return self._tables_with_role(ROLE_INTERMEDIATE)
+
+    def _raw_name(self, node: int) -> bytes:
+        start, end = self._name_offsets[node], self._name_offsets[node + 1]
+        return bytes(self._strings[start:end])
+
+    def _neighbors(
+        self,
+        csr: Tuple[memoryview, memoryview, memoryview],
+        node: int,
+        edge_type: Optional[EdgeType],
+    ) -> List[int]:
+        offsets, neighbors, edge_types = csr
+        start, end = offsets[node], offsets[node + 1]
+        if edge_type is None:
+            return list(neighbors[start:end])
+        return [
+            neighbors[i] for i in range(start, end) if edge_types[i] == edge_type.value
+        ]
+
+    def _tables_with_role(self, role: int) -> List[str]:
+        return sorted(
+            self.name(i) for i in range(self.node_count) if self._roles[i] & role
+        )
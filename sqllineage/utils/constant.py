@@ -9,6 +9,8 @@ class NodeTag:
     SOURCE_ONLY = "source_only"
     TARGET_ONLY = "target_only"
     SELFLOOP = "selfloop"
+    # table whose schema column resolution may look up, tagged in table lineage only analysis
+    SCHEMA = "schema"
 
 
 @unique
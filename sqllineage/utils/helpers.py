@@ -1,9 +1,28 @@
 import logging
+import re
 from argparse import Namespace
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# statements led by these keywords never produce lineage, e.g. session settings, permission and maintenance commands
+NON_LINEAGE_STATEMENT_KEYWORDS = frozenset(
+    {
+        "CACHE",
+        "DELETE",
+        "DESCRIBE",
+        "GRANT",
+        "REFRESH",
+        "REVOKE",
+        "SET",
+        "SHOW",
+        "TRUNCATE",
+        "UNCACHE",
+        "USE",
+    }
+)
+FIRST_KEYWORD_REGEX = re.compile(r"\s*([A-Za-z_]+)")
+
 
 def escape_identifier_name(name: str):
     return name.strip("`").strip('"').strip("'")
@@ -46,3 +65,14 @@ def table_fullname(
             return f"{default_database}.{table}".lower()
 
     return table.lower()
+
+
+def is_non_lineage_statement(sql: str) -> bool:
+    """
+    A cheap check on raw statement text so that statements like SET/USE/GRANT can be skipped before sqlparse builds
+    the token tree. Leading comment is not handled here, such statement will go through the full analysis instead
+    """
+    match = FIRST_KEYWORD_REGEX.match(sql)
+    return (
+        match is not None and match.group(1).upper() in NON_LINEAGE_STATEMENT_KEYWORDS
+    )
@@ -1,4 +1,11 @@
-from typing import Dict, List, Optional
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqllineage.exceptions import SQLLineageException
+
+# (platform, account) -> column names, for the same table
+TableSchemas = Dict[Tuple[str, str], List[str]]
 
 
 class SchemaFetcher:
@@ -14,6 +21,18 @@ class SchemaFetcher:
         """
         raise NotImplementedError
 
+    def get_schemas(
+        self,
+        tables: List[str],
+        platform: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        get the column names of each table, by calling get_schema one table at a time. Override it if the catalog
+        supports looking up multiple tables in one request
+        """
+        return {table: self.get_schema(table, platform, account) for table in tables}
+
 
 class DummySchemaFetcher(SchemaFetcher):
     """
@@ -27,3 +46,194 @@ class DummySchemaFetcher(SchemaFetcher):
         self, table: str, platform: Optional[str] = None, account: Optional[str] = None
     ) -> List[str]:
         return self._schemas.get(table, [])
+
+
+class FileSchemaFetcher(SchemaFetcher):
+    """
+    Schema fetcher backed by a local file of (platform, account, table, column) rows, e.g. an export of
+    information_schema. Table, platform and account are matched case-insensitively, and a row with empty platform or
+    account matches any. Columns are returned in the order of rows
+    """
+
+    FORMATS = ("json", "jsonl", "csv", "sqlite")
+
+    def __init__(
+        self, path: str, fmt: Optional[str] = None, sqlite_table: str = "schemas"
+    ) -> None:
+        """
+        JSON, JSON Lines and CSV files are loaded into an in-memory hash index on first lookup. SQLite file is queried
+        on each lookup instead, which is indexed with an index on the table column with COLLATE NOCASE.
+
+        :param path: path of the file
+        :param fmt: "json" for an array of row objects, "jsonl", "csv" with a header row, or "sqlite", inferred from
+            file extension when not specified
+        :param sqlite_table: the table holding the rows in SQLite file, a plain identifier
+        """
+        if fmt is None:
+            ext = os.path.splitext(path)[1].lower().lstrip(".")
+            fmt = "sqlite" if ext in ("db", "sqlite", "sqlite3") else ext
+        if fmt not in self.FORMATS:
+            raise SQLLineageException("Unsupported schema file format %s" % fmt)
+        if not sqlite_table.isidentifier():
+            # it's interpolated into the query, as table name can't be bound as parameter
+            raise SQLLineageException("Invalid SQLite table name %s" % sqlite_table)
+        self._path = path
+        self._fmt = fmt
+        self._sqlite_table = sqlite_table
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, TableSchemas]] = None
+        self._conn: Any = None
+
+    def __getstate__(self):
+        # index and connection are rebuilt lazily after unpickling, e.g. in worker process
+        return self._path, self._fmt, self._sqlite_table
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def get_schema(
+        self, table: str, platform: Optional[str] = None, account: Optional[str] = None
+    ) -> List[str]:
+        return self.get_schemas([table], platform, account)[table]
+
+    def get_schemas(
+        self,
+        tables: List[str],
+        platform: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        if self._fmt == "sqlite":
+            found = self._query(list({table.lower() for table in tables}))
+        else:
+            found = self._load()
+        return {
+            table: self._pick(found.get(table.lower(), {}), platform, account)
+            for table in tables
+        }
+
+    @staticmethod
+    def _pick(
+        schemas: TableSchemas, platform: Optional[str], account: Optional[str]
+    ) -> List[str]:
+        platform, account = (platform or "").lower(), (account or "").lower()
+        for key in ((platform, account), (platform, ""), ("", "")):
+            if key in schemas:
+                return list(schemas[key])
+        return []
+
+    def _rows(self) -> Iterator[Dict[str, Any]]:
+        import csv
+        import json
+
+        with open(self._path, newline="", encoding="utf-8") as f:
+            if self._fmt == "csv":
+                yield from csv.DictReader(f)
+            elif self._fmt == "jsonl":
+                yield from (json.loads(line) for line in f if line.strip())
+            else:
+                yield from json.load(f)
+
+    def _load(self) -> Dict[str, TableSchemas]:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    index: Dict[str, TableSchemas] = {}
+                    for i, row in enumerate(self._rows(), 1):
+                        table, column = row.get("table"), row.get("column")
+                        if not table or not column:
+                            raise SQLLineageException(
+                                "Row #%d of %s has no table or column" % (i, self._path)
+                            )
+                        key = (
+                            (row.get("platform") or "").lower(),
+                            (row.get("account") or "").lower(),
+                        )
+                        index.setdefault(table.lower(), {}).setdefault(key, []).append(
+                            column
+                        )
+                    self._index = index
+        return self._index
+
+    def _query(self, tables: List[str]) -> Dict[str, TableSchemas]:
+        import sqlite3
+
+        found: Dict[str, TableSchemas] = {}
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(
+                    f"file:{self._path}?mode=ro", uri=True, check_same_thread=False
+                )
+            # stay within the default limit of 999 variables per query
+            for start in range(0, len(tables), 500):
+                end = start + 500
+                chunk = tables[start:end]
+                rows = self._conn.execute(
+                    'SELECT "table", "platform", "account", "column" FROM "%s" '  # nosec B608
+                    'WHERE "table" COLLATE NOCASE IN (%s) ORDER BY rowid'
+                    % (self._sqlite_table, ", ".join("?" * len(chunk))),
+                    chunk,
+                )
+                for table, platform, account, column in rows:
+                    key = ((platform or "").lower(), (account or "").lower())
+                    found.setdefault(table.lower(), {}).setdefault(key, []).append(
+                        column
+                    )
+        return found
+
+
+class PrefetchedSchemaFetcher(SchemaFetcher):
+    """
+    Schema fetcher serving schemas fetched beforehand, keyed by table fullname. Tables not prefetched are recorded in
+    misses, and looked up with fallback fetcher then cached, or have empty schema returned without fallback
+    """
+
+    def __init__(
+        self,
+        schemas: Dict[str, List[str]],
+        fallback: Optional[SchemaFetcher] = None,
+    ) -> None:
+        self._schemas = schemas
+        self._fallback = fallback
+        self.misses: Set[str] = set()
+
+    def get_schema(
+        self, table: str, platform: Optional[str] = None, account: Optional[str] = None
+    ) -> List[str]:
+        if table not in self._schemas:
+            self.misses.add(table)
+            if self._fallback is None:
+                return []
+            self._schemas[table] = self._fallback.get_schema(table, platform, account)
+        return self._schemas[table]
+
+
+class AsyncSchemaFetcher:
+    """
+    Asynchronous counterpart of :class:`SchemaFetcher`, for catalogs behind network round trips. It's used by
+    :class:`sqllineage.aio.AsyncLineageRunner`, which awaits the lookups of all tables concurrently
+    """
+
+    async def get_schema(
+        self, table: str, platform: Optional[str] = None, account: Optional[str] = None
+    ) -> List[str]:
+        """
+        get the column names of the table
+        """
+        raise NotImplementedError
+
+    async def get_schemas(
+        self,
+        tables: List[str],
+        platform: Optional[str] = None,
+        account: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        get the column names of each table, by awaiting get_schema of all tables concurrently. Override it if the
+        catalog supports looking up multiple tables in one request
+        """
+        import asyncio
+
+        schemas = await asyncio.gather(
+            *(self.get_schema(table, platform, account) for table in tables)
+        )
+        return dict(zip(tables, schemas))
@@ -1,7 +1,10 @@
+import functools
 import itertools
+import re
 from typing import Iterator, List, Optional, Tuple, Union
 
 from sqlparse import tokens
+from sqlparse.engine import FilterStack
 from sqlparse.engine.grouping import _group, group_functions
 from sqlparse.sql import (
     Case,
@@ -10,16 +13,114 @@ from sqlparse.sql import (
     Function,
     Identifier,
     Parenthesis,
+    Statement,
+    Token,
     TokenList,
     Where,
 )
-from sqlparse.tokens import DML, Keyword, Name, Wildcard
+from sqlparse.tokens import DML, Keyword, Name, Wildcard, _TokenType
 from sqlparse.utils import imt, recurse
 
+from sqllineage import _monkey_patch
 from sqllineage.utils.entities import SubQueryTuple
 from sqllineage.utils.helpers import escape_identifier_name
 
 
+class StripCommentsFilter:
+    """
+    A replacement of sqlparse.filters.StripCommentsFilter working on the token stream before statement splitting.
+    The original one requires grouping, which means the whole SQL has to be grouped just to get rid of comments.
+    """
+
+    @staticmethod
+    def process(stream: Iterator[Tuple[_TokenType, str]]):
+        prev = None
+        for ttype, value in stream:
+            if ttype in tokens.Comment:
+                if prev is None or prev == (tokens.Punctuation, "("):
+                    # leading comment is removed without leaving whitespace, same as the original filter
+                    continue
+                # keep the line breaks from single line comment so that statements are still delimited correctly
+                match = re.search(r"((\r|\n)+) *$", value)
+                if match is not None:
+                    ttype, value = tokens.Whitespace.Newline, match.groups()[0]
+                else:
+                    ttype, value = tokens.Whitespace, " "
+            prev = (ttype, value)
+            yield ttype, value
+
+
+def split_statements(
+    sql: str, encoding: Optional[str] = None, strip_comments: bool = False
+) -> Iterator[Statement]:
+    """
+    split SQL string into statements with flat token list, a.k.a sqlparse.parse without grouping.
+    Grouping is the most expensive part of parsing, call sqlparse.engine.grouping.group on demand for statements that
+    actually need the token tree.
+    """
+    stack = FilterStack()
+    if strip_comments:
+        stack.preprocess.append(StripCommentsFilter())
+    yield from stack.run(sql, encoding)
+
+
+def get_subquery_depth(stmt: Statement) -> int:
+    """
+    the maximum nesting level of subqueries, computed on a statement with flat token list before grouping.
+    A parenthesis counts as one level only if it contains SELECT directly, so ((SELECT ...)) is still one level.
+    """
+    # for each open parenthesis, whether there's SELECT directly inside
+    paren_stack: List[bool] = []
+    depth = max_depth = 0
+    for token in stmt.tokens:
+        if token.match(tokens.Punctuation, "("):
+            paren_stack.append(False)
+        elif token.match(tokens.Punctuation, ")"):
+            if paren_stack and paren_stack.pop():
+                depth -= 1
+        elif token.match(DML, "SELECT") and paren_stack and not paren_stack[-1]:
+            paren_stack[-1] = True
+            depth += 1
+            max_depth = max(max_depth, depth)
+    return max_depth
+
+
+def remove_values_payload(stmt: Statement) -> Statement:
+    """
+    drop the literal rows of INSERT ... VALUES (...), (...) from a statement with flat token list, before grouping.
+    Data-loading scripts can carry huge VALUES payload, which contributes nothing to lineage but dominates grouping
+    time. Target table and its column list come before VALUES keyword, and whatever follows the rows is kept as is.
+    """
+    if stmt.get_type() != "INSERT":
+        return stmt
+    depth = 0
+    values_idx = None
+    for idx, token in enumerate(stmt.tokens):
+        if token.match(tokens.Punctuation, "("):
+            depth += 1
+        elif token.match(tokens.Punctuation, ")"):
+            depth -= 1
+        elif depth == 0 and token.match(Keyword, "VALUES"):
+            values_idx = idx
+            break
+    if values_idx is None:
+        return stmt
+    end_idx = values_idx + 1
+    for idx in range(values_idx + 1, len(stmt.tokens)):
+        token = stmt.tokens[idx]
+        if token.match(tokens.Punctuation, "("):
+            depth += 1
+        elif token.match(tokens.Punctuation, ")"):
+            depth -= 1
+        elif depth == 0 and not (
+            token.is_whitespace or token.match(tokens.Punctuation, ",")
+        ):
+            break
+        end_idx = idx + 1
+    stmt.tokens = stmt.tokens[: values_idx + 1] + stmt.tokens[end_idx:]
+    return stmt
+
+
 def is_token_negligible(token: TokenList) -> bool:
     # utility to skip tokens like whitespace or comment
     return token.is_whitespace or isinstance(token, Comment)
@@ -284,7 +385,35 @@ def group_functions_as(tlist):
         tidx, token = tlist.token_next_by(t=Name, idx=tidx)
 
 
+def get_token_type(names: Tuple[str, ...]) -> _TokenType:
+    """
+    get token type like Token.Keyword.DML by its names ("Keyword", "DML"). This is used for pickling token types,
+    which are created on attribute access and compared by identity.
+    """
+    return functools.reduce(getattr, names, tokens.Token)
+
+
+def flatten(tlist: TokenList) -> Iterator[Token]:
+    """
+    Iterative replacement of sqlparse.sql.TokenList.flatten. The original one is a recursive generator, which costs
+    one frame per nesting level for each token yielded and hits RecursionError for deeply nested SQL.
+    """
+    stack = [iter(tlist.tokens)]
+    while stack:
+        for token in stack[-1]:
+            if token.is_group:
+                stack.append(iter(token.tokens))
+                break
+            yield token
+        else:
+            stack.pop()
+
+
 def group_function_with_window(tlist):
     group_functions(tlist)
     group_functions_as(tlist)
     group_window(tlist)
+
+
+# sqlparse is patched when this module is first imported, before any sqllineage module could work on sqlparse
+_monkey_patch()
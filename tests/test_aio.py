@@ -0,0 +1,100 @@
+import asyncio
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from sqlparse.engine import grouping
+
+from sqllineage.aio import AsyncLineageRunner
+from sqllineage.core.models import TableMetadata
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.schemaFetcher import AsyncSchemaFetcher, DummySchemaFetcher
+
+SCHEMAS = {
+    "<default>.tab1": ["id", "col1"],
+    "<default>.tab2": ["id", "col2"],
+    "<default>.tab3": ["id", "col3"],
+}
+SQL = """insert into tab4 select col1, col2, col3 from tab1
+join tab2 on tab1.id = tab2.id
+join tab3 on tab1.id = tab3.id;
+insert into tab5 select * from tab4"""
+
+
+class SlowSchemaFetcher(AsyncSchemaFetcher):
+    def __init__(self, schemas: Dict[str, List[str]]) -> None:
+        self.schemas = schemas
+        self.lookups: List[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def get_schema(
+        self, table: str, platform: Optional[str] = None, account: Optional[str] = None
+    ) -> List[str]:
+        self.lookups.append(table)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        return self.schemas.get(table, [])
+
+
+def test_async_runner_with_schema_fetcher():
+    fetcher = SlowSchemaFetcher(SCHEMAS)
+    runner = AsyncLineageRunner(SQL, schema_fetcher=fetcher)
+
+    async def _lineage():
+        return (
+            await runner.source_tables(),
+            await runner.target_tables(),
+            await runner.intermediate_tables(),
+            await runner.get_column_lineage(),
+        )
+
+    expected = LineageRunner(
+        SQL, TableMetadata(schema_fetcher=DummySchemaFetcher(SCHEMAS))
+    )
+    # each statement is grouped once, no matter how many tables need schema
+    with patch("sqllineage.runner.grouping.group", side_effect=grouping.group) as group:
+        lineage = asyncio.run(_lineage())
+    assert group.call_count == 2
+    assert lineage == (
+        expected.source_tables,
+        expected.target_tables,
+        expected.intermediate_tables,
+        expected.get_column_lineage(),
+    )
+    # tab4 is read by the second statement, looked up in the same round
+    assert sorted(fetcher.lookups) == sorted(SCHEMAS) + ["<default>.tab4"]
+    assert fetcher.max_running == 4
+
+
+def test_async_runner_without_schema_fetcher():
+    fetcher = SlowSchemaFetcher(SCHEMAS)
+    sql = "insert into tab2 select col1 from tab1"
+    runner = AsyncLineageRunner(sql, schema_fetcher=fetcher)
+    assert (
+        asyncio.run(runner.get_column_lineage())
+        == LineageRunner(sql).get_column_lineage()
+    )
+    assert fetcher.lookups == []
+
+    runner = AsyncLineageRunner(
+        SQL, TableMetadata(schema_fetcher=DummySchemaFetcher(SCHEMAS))
+    )
+    assert (
+        asyncio.run(runner.get_column_lineage())
+        == LineageRunner(
+            SQL, TableMetadata(schema_fetcher=DummySchemaFetcher(SCHEMAS))
+        ).get_column_lineage()
+    )
+
+
+def test_async_runner_with_conflicting_schema_fetcher():
+    with pytest.raises(SQLLineageException):
+        AsyncLineageRunner(
+            SQL,
+            TableMetadata(schema_fetcher=DummySchemaFetcher(SCHEMAS)),
+            schema_fetcher=SlowSchemaFetcher(SCHEMAS),
+        )
@@ -0,0 +1,92 @@
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from sqllineage.batch import BatchRunner
+from sqllineage.core.models import Table
+from sqllineage.exceptions import SQLLineageException
+
+
+def _write_corpus(tmp_path):
+    paths = []
+    for i, sql in enumerate(
+        [
+            "INSERT INTO tab2 SELECT * FROM tab1",
+            "INSERT INTO tab3 SELECT * FROM tab2",
+            "INSERT INTO tab4 SELECT * FROM tab3",
+        ]
+    ):
+        path = tmp_path / f"{i}.sql"
+        path.write_text(sql)
+        paths.append(str(path))
+    return paths
+
+
+def test_batch_runner(tmp_path):
+    paths = _write_corpus(tmp_path)
+    holder = BatchRunner(paths).run()
+    assert holder.source_tables == {Table("tab1")}
+    assert holder.target_tables == {Table("tab4")}
+    assert holder.intermediate_tables == {Table("tab2"), Table("tab3")}
+
+
+def test_batch_runner_resume(tmp_path):
+    paths = _write_corpus(tmp_path)
+    checkpoint = str(tmp_path / "checkpoint")
+    analyze = BatchRunner._analyze
+    analyzed = []
+
+    def crash_on_last_file(self, path, size, mtime):
+        if path == paths[-1]:
+            raise KeyboardInterrupt
+        analyzed.append(path)
+        return analyze(self, path, size, mtime)
+
+    with patch.object(BatchRunner, "_analyze", crash_on_last_file):
+        with pytest.raises(KeyboardInterrupt):
+            BatchRunner(paths, checkpoint, checkpoint_interval=3600).run()
+    assert analyzed == paths[:2]
+
+    # resumed run only analyzes the file not done yet
+    analyzed.clear()
+    with patch.object(BatchRunner, "_analyze", crash_on_last_file):
+        with pytest.raises(KeyboardInterrupt):
+            BatchRunner(paths, checkpoint).run()
+    assert analyzed == []
+
+    # modified file is analyzed again
+    with open(paths[0], "a") as f:
+        f.write(" WHERE col1 = 1")
+    runner = BatchRunner(paths, checkpoint)
+    with patch.object(BatchRunner, "_analyze", side_effect=analyze, autospec=True) as m:
+        holder = runner.run()
+    assert [call.args[1] for call in m.call_args_list] == [paths[0], paths[2]]
+    assert holder.target_tables == {Table("tab4")}
+    assert set(runner.results) == set(paths)
+
+
+def test_batch_runner_file_failure(tmp_path):
+    paths = _write_corpus(tmp_path)
+    with open(paths[1], "w") as f:
+        f.write("INSERT INTO tab3 SELECT * FROM WHERE col1 = 1")
+    checkpoint = str(tmp_path / "checkpoint")
+    runner = BatchRunner(paths, checkpoint)
+    holder = runner.run()
+    assert runner.results[paths[1]].error is not None
+    assert runner.results[paths[1]].holders == []
+    assert runner.results[paths[1]].elapsed > 0
+    assert runner.results[paths[2]].error is None
+    assert holder.target_tables == {Table("tab2"), Table("tab4")}
+
+    # the failed file is recorded, resumed run analyzes nothing
+    with patch.object(BatchRunner, "_analyze") as m:
+        BatchRunner(paths, checkpoint).run()
+    m.assert_not_called()
+
+
+def test_batch_runner_checkpoint_version_mismatch(tmp_path):
+    checkpoint = tmp_path / "checkpoint"
+    checkpoint.write_bytes(pickle.dumps((0, {})))
+    with pytest.raises(SQLLineageException):
+        BatchRunner(_write_corpus(tmp_path), str(checkpoint)).run()
@@ -0,0 +1,40 @@
+import pytest
+from benchmarks.import_time import benchmark as import_benchmark
+from benchmarks.scaling import scale
+from benchmarks.tpcds import PHASES, benchmark, compare
+from benchmarks.workload import WORKLOADS
+
+from sqllineage.runner import LineageRunner
+
+
+def test_tpcds_benchmark():
+    result = benchmark([1], repeat=1)
+    query = result["queries"]["query01"]
+    for phase in PHASES:
+        assert query[phase]["min"] <= query[phase]["median"]
+        assert result["total"][phase] == query[phase]["median"]
+    assert query["peak_memory"] > 0
+    assert not compare(result, result, threshold=0.1)
+
+
+@pytest.mark.parametrize("workload", list(WORKLOADS))
+def test_workload(workload):
+    runner = LineageRunner(WORKLOADS[workload](3))
+    assert runner.source_tables
+    assert runner.target_tables
+    assert runner.get_column_lineage()
+
+
+def test_scaling_benchmark():
+    steps = scale("wide_select", [2, 4], repeat=1)
+    assert [step["size"] for step in steps] == [2, 4]
+    assert "exponent" not in steps[0]
+    assert set(steps[1]["exponent"]) == set(PHASES) | {"total"}
+
+
+def test_import_time_benchmark():
+    result = import_benchmark(["sqllineage", "sqllineage.runner"], repeat=1)
+    assert result["sqllineage"]["min"] < result["sqllineage.runner"]["min"]
+    # heavy dependencies are imported on first use
+    assert "sqlparse" not in result["sqllineage"]["packages"]
+    assert "networkx" not in result["sqllineage.runner"]["packages"]
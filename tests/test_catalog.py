@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+from sqllineage.catalog import LineageCatalog
+from sqllineage.core.models import Table
+from sqllineage.runner import LineageRunner
+
+
+def test_catalog(tmp_path):
+    db = str(tmp_path / "catalog.db")
+    with LineageCatalog(db) as catalog:
+        assert catalog.update_file(
+            "a.sql",
+            """INSERT INTO tab2 SELECT col1 FROM tab1;
+INSERT INTO tab3 SELECT col1 FROM tab2""",
+        )
+        assert catalog.update_file("b.sql", "INSERT INTO tab4 SELECT col1 FROM tab3")
+        assert not catalog.update_file(
+            "b.sql", "INSERT INTO tab4 SELECT col1 FROM tab3"
+        )
+        assert catalog.files() == ["a.sql", "b.sql"]
+        holder = catalog.lineage()
+        assert holder.source_tables == {Table("tab1")}
+        assert holder.target_tables == {Table("tab4")}
+        assert holder.intermediate_tables == {Table("tab2"), Table("tab3")}
+        [(path, index, _)] = catalog.provenance("<default>.tab2", "<default>.tab3")
+        assert (path, index) == ("a.sql", 1)
+        [(path, index, _)] = catalog.provenance(
+            "<default>.tab3.col1", "<default>.tab4.col1"
+        )
+        assert (path, index) == ("b.sql", 0)
+
+    # reopened catalog keeps the lineage, changed file replaces only its own contributions
+    with LineageCatalog(db) as catalog:
+        assert catalog.update_file("b.sql", "INSERT INTO tab5 SELECT col1 FROM tab3")
+        holder = catalog.lineage()
+        assert holder.target_tables == {Table("tab5")}
+        assert catalog.provenance("<default>.tab3", "<default>.tab4") == []
+        assert len(catalog.provenance("<default>.tab2", "<default>.tab3")) == 1
+        catalog.remove_file("a.sql")
+        assert catalog.files() == ["b.sql"]
+        assert catalog.lineage().source_tables == {Table("tab3")}
+        # nodes not referenced by any file are removed
+        names = {row[0] for row in catalog._conn.execute("SELECT name FROM nodes")}
+        assert "<default>.tab1" not in names
+
+
+def test_catalog_column_lineage(tmp_path):
+    sql = """INSERT INTO tab2 SELECT a.col1, b.col2 FROM tab1 a JOIN tab3 b ON a.id = b.id;
+INSERT INTO tab4 SELECT col1, col2 FROM tab2"""
+    with LineageCatalog(str(tmp_path / "catalog.db")) as catalog:
+        catalog.update_file("a.sql", sql)
+        lr = LineageRunner(sql)
+        lr._eval()
+        assert (
+            catalog.lineage().get_column_lineage()
+            == lr._sql_holder.get_column_lineage()
+        )
+
+
+def test_catalog_subquery_node(tmp_path):
+    db = str(tmp_path / "catalog.db")
+    sql = "INSERT INTO tab2 SELECT col1 FROM (SELECT col1 FROM tab1 WHERE col1 > 1)"
+    with LineageCatalog(db) as catalog:
+        catalog.update_file("a.sql", sql)
+        names = {row[0] for row in catalog._conn.execute("SELECT name FROM nodes")}
+    # subquery without alias is named the same in another process, instead of adding a node each run
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from sqllineage.catalog import LineageCatalog; "
+            "LineageCatalog(sys.argv[1]).update_file('b.sql', sys.argv[2])",
+            db,
+            sql,
+        ],
+        check=True,
+    )
+    with LineageCatalog(db) as catalog:
+        assert {
+            row[0] for row in catalog._conn.execute("SELECT name FROM nodes")
+        } == names
+        assert catalog.lineage().source_tables == {Table("tab1")}
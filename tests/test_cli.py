@@ -1,4 +1,6 @@
 import pathlib
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -36,3 +38,16 @@ def test_file_permission_error(_):
     with pytest.raises(SystemExit) as e:
         main(["-f", __file__])
     assert e.value.code == 1
+
+
+def test_cli_lazy_imports():
+    # drawing server and networkx are not imported until needed
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from sqllineage.cli import main; main(['-e', 'select * from dual']); "
+            "assert 'sqllineage.drawing' not in sys.modules and 'wsgiref' not in sys.modules",
+        ],
+        check=True,
+    )
@@ -1307,3 +1307,18 @@ def test_subquery_with_alias():
             ),
         ],
     )
+
+
+def test_column_reference_from_deeply_nested_subquery():
+    sql = "SELECT col1 FROM tab2"
+    for i in range(150):
+        sql = f"SELECT col1 FROM ({sql}) dt{i}"
+    assert_column_lineage_equal(
+        f"INSERT INTO tab1 {sql}",
+        [
+            (
+                ColumnQualifierTuple("col1", "tab2"),
+                ColumnQualifierTuple("col1", "tab1"),
+            ),
+        ],
+    )
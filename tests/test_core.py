@@ -1,5 +1,145 @@
-from sqllineage.core.holders import StatementLineageHolder
+import pickle
+
+import networkx as nx
+import pytest
+
+from sqllineage.core.holders import SQLLineageHolder, StatementLineageHolder
+from sqllineage.core.models import Column, Table
+from sqllineage.core.reachability import ReachabilityIndex
+from sqllineage.core.serialization import decode_graph, encode_graph
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import LineageRunner
 
 
 def test_dummy():
     assert str(StatementLineageHolder()) == repr(StatementLineageHolder())
+
+
+def test_holder_pickle():
+    lr = LineageRunner("""INSERT OVERWRITE TABLE tab1
+SELECT a.col1, b.col2
+FROM (SELECT col1, id FROM tab2) a
+         JOIN tab3 b ON a.id = b.id;
+INSERT INTO tab4 SELECT col1, col2 FROM tab1 t JOIN tab5 s ON t.col1 = s.col1""")
+    lr._eval()
+    for holder in lr.statement_holders:
+        restored = pickle.loads(pickle.dumps(holder))
+        assert isinstance(restored, StatementLineageHolder)
+        assert list(restored.graph.nodes(data=True)) == list(
+            holder.graph.nodes(data=True)
+        )
+        assert list(restored.graph.edges(data=True)) == list(
+            holder.graph.edges(data=True)
+        )
+        assert str(restored) == str(holder)
+        assert restored.get_column_lineage() == holder.get_column_lineage()
+    sql_holder = pickle.loads(pickle.dumps(lr._sql_holder))
+    assert isinstance(sql_holder, SQLLineageHolder)
+    assert sql_holder.source_tables == lr._sql_holder.source_tables
+    assert sql_holder.target_tables == lr._sql_holder.target_tables
+    assert sql_holder.intermediate_tables == lr._sql_holder.intermediate_tables
+    assert sql_holder.get_column_lineage() == lr._sql_holder.get_column_lineage()
+    assert (
+        SQLLineageHolder.of(
+            *[pickle.loads(pickle.dumps(h)) for h in lr.statement_holders]
+        ).get_column_lineage()
+        == lr._sql_holder.get_column_lineage()
+    )
+
+
+def test_decode_graph_version_mismatch():
+    _, objects, nodes, edges = encode_graph(StatementLineageHolder().graph)
+    with pytest.raises(SQLLineageException):
+        decode_graph((0, objects, nodes, edges))
+
+
+def test_sql_holder_cached_views():
+    lr = LineageRunner(
+        "INSERT INTO tab2 SELECT col1 FROM tab1; INSERT INTO tab3 SELECT col1 FROM tab2"
+    )
+    lr._eval()
+    holder = lr._sql_holder
+    assert holder.table_lineage_graph is holder.table_lineage_graph
+    # callers get a copy, modifying it leaves the cached set intact
+    holder.source_tables.clear()
+    assert {str(t) for t in holder.source_tables} == {"<default>.tab1"}
+    assert {str(t) for t in holder.intermediate_tables} == {"<default>.tab2"}
+    # reassigning graph drops the cached views
+    holder.graph = SQLLineageHolder.of(lr.statement_holders[0]).graph
+    assert {str(t) for t in holder.source_tables} == {"<default>.tab1"}
+    assert {str(t) for t in holder.target_tables} == {"<default>.tab2"}
+    assert holder.intermediate_tables == set()
+    # modification in place needs explicit invalidation
+    holder.graph.remove_node(next(iter(holder.target_tables)))
+    holder.invalidate()
+    assert holder.target_tables == set()
+
+
+def test_sql_holder_upstream_downstream():
+    lr = LineageRunner("""INSERT INTO tab2 SELECT col1 FROM tab1;
+INSERT INTO tab3 SELECT col1 FROM tab2;
+INSERT INTO tab4 SELECT col1 FROM tab3;
+INSERT INTO tab5 SELECT col1 FROM tab6""")
+    lr._eval()
+    holder = lr._sql_holder
+    assert set(holder.upstream(Table("tab4")).nodes) == {
+        Table("tab1"),
+        Table("tab2"),
+        Table("tab3"),
+        Table("tab4"),
+    }
+    assert set(holder.upstream(Table("tab4"), depth=1).nodes) == {
+        Table("tab3"),
+        Table("tab4"),
+    }
+    assert set(holder.downstream(Table("tab2"), depth=0).nodes) == {Table("tab2")}
+    assert set(holder.downstream(Table("tab6")).edges) == {
+        (Table("tab6"), Table("tab5"))
+    }
+    col1 = Column("col1")
+    col1.parent = Table("tab2")
+    assert {str(c) for c in holder.downstream(col1).nodes} == {
+        "<default>.tab2.col1",
+        "<default>.tab3.col1",
+        "<default>.tab4.col1",
+    }
+    assert len(holder.downstream(Table("tab7")).nodes) == 0
+
+
+def test_reachability_index():
+    graph = nx.gnp_random_graph(60, 0.05, seed=1, directed=True)
+    graph.add_edge(7, 7)
+    index = ReachabilityIndex(graph)
+    for node in graph.nodes:
+        descendants = nx.descendants(graph, node)
+        ancestors = nx.ancestors(graph, node)
+        # node on a cycle reaches itself
+        if any(nx.has_path(graph, succ, node) for succ in graph.succ[node]):
+            descendants.add(node)
+            ancestors.add(node)
+        assert index.descendants(node) == descendants
+        assert index.ancestors(node) == ancestors
+    assert index.is_upstream(0, 1) == nx.has_path(graph, 0, 1)
+    assert not index.is_upstream(0, "unknown")
+
+    # incremental update gives the same closure as building from scratch
+    incremental = ReachabilityIndex(graph.subgraph(range(30)))
+    incremental.add_edges_from(e for e in graph.edges if e[0] >= 30 or e[1] >= 30)
+    for node in graph.nodes:
+        assert incremental.descendants(node) == index.descendants(node)
+        assert incremental.ancestors(node) == index.ancestors(node)
+
+
+def test_reachability_index_table_lineage():
+    lr = LineageRunner("""INSERT INTO tab2 SELECT col1 FROM tab1;
+INSERT INTO tab3 SELECT col1 FROM tab2""")
+    lr._eval()
+    index = ReachabilityIndex(lr._sql_holder.table_lineage_graph)
+    assert index.is_upstream(Table("tab1"), Table("tab3"))
+    assert not index.is_upstream(Table("tab3"), Table("tab1"))
+    index.add_edge(Table("tab3"), Table("tab4"))
+    assert index.descendants(Table("tab1")) == {
+        Table("tab2"),
+        Table("tab3"),
+        Table("tab4"),
+    }
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+
+from sqllineage.diff import lineage_diff
+from sqllineage.runner import LineageRunner
+from sqllineage.snapshot import LineageSnapshot, save_snapshot
+from sqllineage.utils.constant import EdgeType
+
+
+def _holder(sql):
+    lr = LineageRunner(sql)
+    lr._eval()
+    return lr._sql_holder
+
+
+def test_lineage_diff(tmp_path):
+    old = _holder("""INSERT INTO tab2 SELECT col1, col2 FROM tab1;
+INSERT INTO tab3 SELECT col1 FROM tab2""")
+    new = _holder("""INSERT INTO tab2 SELECT col1 FROM tab1;
+INSERT INTO tab4 SELECT col1 FROM tab2""")
+    diff = lineage_diff(old, new)
+    assert diff.changed
+    assert diff.added_tables == {"<default>.tab4"}
+    assert diff.removed_tables == {"<default>.tab3"}
+    assert diff.added_columns == {"<default>.tab4.col1"}
+    assert diff.removed_columns == {
+        "<default>.tab1.col2",
+        "<default>.tab2.col2",
+        "<default>.tab3.col1",
+    }
+    assert ("<default>.tab2", "<default>.tab4", EdgeType.LINEAGE) in diff.added_edges
+    assert (
+        "<default>.tab2.col1",
+        "<default>.tab3.col1",
+        EdgeType.LINEAGE,
+    ) in diff.removed_edges
+    assert not lineage_diff(old, old).changed
+
+    # snapshots give the same diff as holders
+    old_path, new_path = str(tmp_path / "old"), str(tmp_path / "new")
+    save_snapshot(old, old_path)
+    save_snapshot(new, new_path)
+    with LineageSnapshot(old_path) as old_snapshot, LineageSnapshot(
+        new_path
+    ) as new_snapshot:
+        assert lineage_diff(old_snapshot, new_snapshot) == diff
+        assert lineage_diff(old, new_snapshot) == diff
+
+
+def test_lineage_diff_across_processes(tmp_path):
+    sql = "INSERT INTO t SELECT a FROM (SELECT a FROM s WHERE a > 1)"
+    path = str(tmp_path / "snapshot")
+    # subquery without alias is named the same in another process, so unchanged SQL gives no diff
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from sqllineage.runner import LineageRunner; "
+            "from sqllineage.snapshot import save_snapshot; "
+            "lr = LineageRunner(sys.argv[2]); lr._eval(); save_snapshot(lr._sql_holder, sys.argv[1])",
+            path,
+            sql,
+        ],
+        check=True,
+    )
+    with LineageSnapshot(path) as snapshot:
+        assert not lineage_diff(snapshot, _holder(sql)).changed
@@ -3,10 +3,13 @@ import os.path
 from collections import namedtuple
 from http import HTTPStatus
 from io import StringIO
+from unittest.mock import patch
+from urllib.parse import urlencode
 
 import pytest
 
-from sqllineage.drawing import app
+from sqllineage.drawing import ResponseCache, app, lineage_cache
+from sqllineage.runner import LineageRunner
 
 
 @pytest.mark.skip(reason="Skip the drawing test since it's not used")
@@ -71,3 +74,103 @@ def test_handler():
     assert container.status.startswith(str(HTTPStatus.METHOD_NOT_ALLOWED.value))
     mock_request("DELETE", "/")
     assert container.status.startswith(str(HTTPStatus.METHOD_NOT_ALLOWED.value))
+
+
+def _post(path, body, headers=None):
+    response = {}
+
+    def start_response(status, header):
+        response["status"] = status
+        response["header"] = dict(header)
+
+    with StringIO() as f:
+        length = f.write(json.dumps(body))
+        f.seek(0)
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": path,
+            "CONTENT_LENGTH": length,
+            "wsgi.input": f,
+            **(headers or {}),
+        }
+        response["body"] = b"".join(app(environ, start_response))
+    return response
+
+
+def _get(path, querystring, headers=None):
+    response = {}
+
+    def start_response(status, header):
+        response["status"] = status
+        response["header"] = dict(header)
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": querystring,
+        **(headers or {}),
+    }
+    response["body"] = b"".join(app(environ, start_response))
+    return response
+
+
+def test_lineage_cache():
+    lineage_cache.clear()
+    sql = "insert into tab2 select col1 from tab1"
+    with patch("sqllineage.runner.LineageRunner", wraps=LineageRunner) as runner:
+        first = _post("/lineage", {"e": sql})
+        assert first["status"].startswith(str(HTTPStatus.OK.value))
+        assert "tab1" in json.loads(first["body"])["verbose"]
+        etag = first["header"]["ETag"]
+        second = _post("/lineage", {"e": sql})
+        assert second["body"] == first["body"]
+        assert second["header"]["ETag"] == etag
+        assert runner.call_count == 1
+
+        querystring = urlencode({"e": sql})
+        fetched = _get("/lineage", querystring)
+        assert fetched["status"].startswith(str(HTTPStatus.OK.value))
+        assert fetched["body"] == first["body"]
+        assert fetched["header"]["ETag"] == etag
+
+        revalidated = _get(
+            "/lineage", querystring, {"HTTP_IF_NONE_MATCH": f'"other", {etag}'}
+        )
+        assert revalidated["status"].startswith(str(HTTPStatus.NOT_MODIFIED.value))
+        assert revalidated["body"] == b""
+
+        # 304 is only for GET and HEAD, a conditional POST fails its precondition
+        precondition = _post(
+            "/lineage", {"e": sql}, {"HTTP_IF_NONE_MATCH": f'"other", {etag}'}
+        )
+        assert precondition["status"].startswith(
+            str(HTTPStatus.PRECONDITION_FAILED.value)
+        )
+        assert precondition["body"] == b""
+        assert runner.call_count == 1
+
+        changed = _post("/lineage", {"e": sql + " where col2 = 1"})
+        assert changed["header"]["ETag"] != etag
+        assert runner.call_count == 2
+
+        error = _post("/lineage", {"e": "SELECT * FROM where foo='bar'"})
+        assert error["status"].startswith(str(HTTPStatus.BAD_REQUEST.value))
+        assert len(lineage_cache) == 2
+    lineage_cache.clear()
+
+
+def test_response_cache_bounded():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"
+    cache.put("c", b"1234")
+    # b is least recently used
+    assert cache.get("b") is None
+    # a is evicted to keep within 10 bytes
+    cache.put("d", b"123456")
+    assert cache.get("a") is None
+    assert len(cache) == 2
+    cache.put("e", b"12345678901")
+    assert cache.get("e") is None
+    assert len(cache) == 2
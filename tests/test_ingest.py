@@ -0,0 +1,136 @@
+import csv
+import json
+import os
+import tempfile
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from sqllineage.core.models import Path, Table
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.ingest import (
+    QueryLogIngestor,
+    fingerprint_query,
+    normalize_query,
+    read_query_log,
+)
+
+
+def test_normalize_query():
+    assert (
+        normalize_query("""SELECT a, b FROM Tab1  -- comment
+WHERE x IN (1,2, 3) AND y='abc' AND z in(4);""")
+        == "select a, b from tab1 where x in (?) and y=? and z in (?)"
+    )
+    assert (
+        normalize_query("INSERT INTO tab1 VALUES (1, 'a'), (2,'b')")
+        == "insert into tab1 values (?, ?)"
+    )
+
+
+def test_fingerprint_query():
+    assert fingerprint_query(
+        "select * from tab1 where id in (1, 2)"
+    ) == fingerprint_query("SELECT *\n  FROM tab1\n WHERE id IN (3, 4, 5, 6)")
+    assert fingerprint_query("select * from tab1") != fingerprint_query(
+        "select * from tab2"
+    )
+
+
+def test_fingerprint_query_keeps_path_literal():
+    assert (
+        normalize_query(
+            "INSERT OVERWRITE DIRECTORY 'hdfs://a/Out1' SELECT * FROM tab1 WHERE dt = '2023-01-01'"
+        )
+        == "insert overwrite directory 'hdfs://a/Out1' select * from tab1 where dt = ?"
+    )
+    assert normalize_query("LOAD DATA INPATH 'data.csv' INTO TABLE tab1") == (
+        "load data inpath 'data.csv' into table tab1"
+    )
+    assert normalize_query("SELECT * FROM tab1 WHERE f = 's3://b/x'") == (
+        "select * from tab1 where f = 's3://b/x'"
+    )
+    ingestor = QueryLogIngestor()
+    results = list(
+        ingestor.ingest(
+            [
+                {
+                    "query": "INSERT OVERWRITE DIRECTORY 'hdfs://a/out1' SELECT * FROM tab1"
+                },
+                {
+                    "query": "INSERT OVERWRITE DIRECTORY 'hdfs://b/out2' SELECT * FROM tab1"
+                },
+            ]
+        )
+    )
+    assert results[0].fingerprint != results[1].fingerprint
+    assert results[0].lineage.target_tables == [Path("hdfs://a/out1")]
+    assert results[1].lineage.target_tables == [Path("hdfs://b/out2")]
+
+
+def test_ingest_fan_out():
+    ingestor = QueryLogIngestor()
+    records = [
+        {
+            "id": 1,
+            "query": "INSERT INTO tab2 SELECT * FROM tab1 WHERE dt = '2023-01-01'",
+        },
+        {
+            "id": 2,
+            "query": "insert into tab2 select * from tab1 where dt = '2023-01-02'",
+        },
+        {"id": 3, "query": "INSERT INTO tab3 SELECT * FROM tab2"},
+        {"id": 4, "query": "select * from where foo='bar'"},
+    ]
+    results = list(ingestor.ingest(records))
+    assert [r.record["id"] for r in results] == [1, 2, 3, 4]
+    assert results[0].lineage is results[1].lineage
+    assert results[0].lineage.source_tables == [Table("tab1")]
+    assert results[0].lineage.target_tables == [Table("tab2")]
+    assert results[2].lineage.source_tables == [Table("tab2")]
+    assert results[3].lineage.error is not None
+    assert ingestor.records_count == 4
+    assert ingestor.fingerprints_count == 3
+
+
+def test_ingest_unexpected_error():
+    ingestor = QueryLogIngestor()
+    with patch(
+        "sqllineage.ingest.LineageRunner.source_tables",
+        new_callable=PropertyMock,
+        side_effect=[RecursionError("maximum recursion depth exceeded"), []],
+    ):
+        results = list(
+            ingestor.ingest(
+                [
+                    {"query": "INSERT INTO tab2 SELECT * FROM tab1"},
+                    {"query": "INSERT INTO tab3 SELECT * FROM tab2"},
+                ]
+            )
+        )
+    assert (
+        results[0].lineage.error == "RecursionError: maximum recursion depth exceeded"
+    )
+    assert results[1].lineage.error is None
+
+
+def test_read_query_log():
+    records = [
+        {"user": "u1", "query": "select * from tab1"},
+        {"user": "u2", "query": "select 1"},
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jsonl_path = os.path.join(tmpdir, "log.jsonl")
+        with open(jsonl_path, "w") as f:
+            f.write("\n".join(json.dumps(r) for r in records) + "\n\n")
+        csv_path = os.path.join(tmpdir, "log.csv")
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["user", "query"])
+            writer.writeheader()
+            writer.writerows(records)
+        assert list(read_query_log(jsonl_path)) == records
+        assert list(read_query_log(csv_path)) == records
+        results = list(QueryLogIngestor().ingest_file(csv_path))
+        assert results[0].lineage.source_tables == [Table("tab1")]
+        with pytest.raises(SQLLineageException):
+            list(read_query_log(csv_path, query_column="sql"))
@@ -1,3 +1,5 @@
+from sqllineage.core.models import Table
+from sqllineage.runner import LineageRunner
 from .helpers import assert_table_lineage_equal
 
 
@@ -94,3 +96,17 @@ ON tab_1.col_a = tab_2.cola""",
         {"tab_1", "tab_2"},
         {"tab_1"},
     )
+
+
+def test_insert_into_with_large_values_payload():
+    rows = ", ".join(f"({i}, 'val{i}')" for i in range(10000))
+    assert_table_lineage_equal(
+        f"INSERT INTO tab1 (col1, col2) VALUES {rows}", set(), {"tab1"}
+    )
+
+
+def test_insert_into_values_keeps_statement_text():
+    sql = "INSERT INTO tab1 (col1, col2) VALUES (1, 'a'), (2, 'b')"
+    lr = LineageRunner(sql)
+    assert lr.statements() == [sql]
+    assert lr.target_tables == [Table("tab1")]
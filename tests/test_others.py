@@ -1,3 +1,9 @@
+import subprocess
+import sys
+
+import pytest
+
+from sqllineage.core.models import Table
 from sqllineage.runner import LineageRunner
 from .helpers import assert_table_lineage_equal
 
@@ -6,6 +12,32 @@ def test_use():
     assert_table_lineage_equal("USE db1")
 
 
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SET hive.exec.dynamic.partition=true",
+        "GRANT SELECT ON TABLE tab1 TO user1",
+        "REVOKE SELECT ON TABLE tab1 FROM user1",
+        "SHOW TABLES",
+        "DESCRIBE tab1",
+        "TRUNCATE TABLE tab1",
+        "DELETE FROM tab1 WHERE col1 IN (SELECT col1 FROM tab2)",
+    ],
+)
+def test_non_lineage_statement(sql):
+    assert_table_lineage_equal(sql)
+
+
+def test_non_lineage_statement_mixed_in_script():
+    lr = LineageRunner("""SET hive.exec.dynamic.partition=true;
+USE db1;
+INSERT OVERWRITE TABLE tab1 SELECT * FROM tab2;
+GRANT SELECT ON TABLE tab1 TO user1;""")
+    assert len(lr.statements_parsed) == 4
+    assert lr.source_tables == [Table("tab2")]
+    assert lr.target_tables == [Table("tab1")]
+
+
 def test_table_name_case():
     assert_table_lineage_equal(
         """insert overwrite table tab_a
@@ -253,6 +285,19 @@ LATERAL VIEW OUTER explode(sc.json_array) q AS col1"""
     assert_table_lineage_equal(sql, {"bar"}, {"foo"})
 
 
+def test_lateral_view_outer_with_sqlparse_used_before_patching():
+    # sqlparse is patched on importing sqllineage.runner, a lexer already initialized by then is re-initialized
+    code = """import sqlparse
+sqlparse.parse("SELECT 1")
+import sqllineage.runner
+sql = "SELECT q.col1 FROM bar sc LATERAL VIEW OUTER explode(sc.arr) q AS col1"
+print([t.value for t in sqlparse.parse(sql)[0].flatten() if t.is_keyword])"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "'LATERAL VIEW OUTER explode'" in result.stdout
+
+
 def test_show_create_table():
     assert_table_lineage_equal("show create table tab1", None, None)
 
@@ -1,5 +1,29 @@
-from sqllineage.runner import LineageRunner
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from sqlparse.engine import grouping
+from sqlparse.lexer import Lexer
+
+import sqllineage.runner
+from sqllineage import DATA_FOLDER
+from sqllineage.core.handlers.source import SourceHandler
+from sqllineage.core.models import Column, Table, TableMetadata
+from sqllineage.runner import (
+    AnalysisLimits,
+    LineageRunner,
+    _analyze_statement_sql,
+    _init_worker,
+    _schedule_chunks,
+)
 from sqllineage.utils.constant import LineageLevel
+from sqllineage.utils.schemaFetcher import DummySchemaFetcher
 
 
 def test_runner_dummy():
@@ -11,3 +35,290 @@ insert overwrite table tab3 select * from tab2""",
     assert str(runner)
     assert runner.to_cytoscape() is not None
     assert runner.to_cytoscape(level=LineageLevel.COLUMN) is not None
+
+
+def test_runner_limits_statement_length():
+    runner = LineageRunner(
+        """insert into tab2 select col1 from tab1;
+insert into tab3 select col1 from tab2 where col2 = 'a very long literal to exceed the limit'""",
+        limits=AnalysisLimits(max_statement_length=50),
+    )
+    assert runner.source_tables == [Table("tab1")]
+    assert runner.target_tables == [Table("tab2")]
+    assert len(runner.warnings) == 1
+    assert runner.warnings[0].startswith("Statement #2: skipped")
+
+
+def test_runner_limits_subquery_depth():
+    sql = "insert into tab2 select col1 from (select col1 from (select col1 from tab1) t1) t2"
+    runner = LineageRunner(sql, limits=AnalysisLimits(max_subquery_depth=1))
+    assert runner.source_tables == []
+    assert runner.target_tables == []
+    assert len(runner.warnings) == 1
+    runner = LineageRunner(sql, limits=AnalysisLimits(max_subquery_depth=2))
+    assert runner.source_tables == [Table("tab1")]
+    assert runner.warnings == []
+
+
+def test_runner_limits_token_count():
+    runner = LineageRunner(
+        "insert into tab2 select col1, col2 from (select col1, col2 from tab1) t",
+        limits=AnalysisLimits(max_token_count=5),
+    )
+    # columns are not resolved at all, instead of being dropped after analysis
+    with patch.object(SourceHandler, "_handle_column") as handle_column:
+        assert runner.source_tables == [Table("tab1")]
+        assert runner.target_tables == [Table("tab2")]
+    handle_column.assert_not_called()
+    assert runner.get_column_lineage() == []
+    assert len(runner.warnings) == 1
+
+
+def test_runner_limits_seconds():
+    runner = LineageRunner(
+        "insert into tab2 select col1, col2 from tab1",
+        limits=AnalysisLimits(max_seconds=0),
+    )
+    assert runner.source_tables == []
+    assert runner.target_tables == []
+    assert len(runner.warnings) == 1
+
+
+def test_runner_limits_seconds_grouping():
+    group = grouping.group
+
+    def _slow_group(stmt):
+        time.sleep(0.2)
+        return group(stmt)
+
+    with patch("sqllineage.runner.grouping.group", side_effect=_slow_group):
+        runner = LineageRunner(
+            "insert into tab2 select col1, col2 from tab1",
+            limits=AnalysisLimits(max_seconds=0.1),
+        )
+        assert runner.source_tables == []
+    assert runner.warnings == [
+        "Statement #1: skipped, analysis exceeds max_seconds 0.1"
+    ]
+
+
+def test_runner_with_workers():
+    sql = """insert into tab2 select col1, col2 from tab1;
+insert into tab3 select t2.col1, t4.col2 from tab2 t2 join tab4 t4 on t2.id = t4.id;
+SET hive.exec.dynamic.partition=true;
+insert into tab5 select * from (select col1 from tab3) dt;"""
+    sequential = LineageRunner(sql)
+    parallel = LineageRunner(sql, workers=2)
+    assert parallel.source_tables == sequential.source_tables
+    assert parallel.target_tables == sequential.target_tables
+    assert parallel.intermediate_tables == sequential.intermediate_tables
+    assert parallel.get_column_lineage() == sequential.get_column_lineage()
+    assert parallel.statements() == sequential.statements()
+
+
+def _crash_or_hang(sql, metadata, limits):
+    if "crash" in sql:
+        os._exit(1)
+    elif "hang" in sql:
+        time.sleep(10)
+    return _analyze_statement_sql(sql, metadata, limits)
+
+
+def _init_faulty_worker(*args):
+    # patched in worker process itself, so that it works no matter how the worker is started, fork or spawn
+    _init_worker(*args)
+    sqllineage.runner._analyze_statement_sql = _crash_or_hang
+
+
+@pytest.mark.parametrize(
+    "start_method",
+    [m for m in ("fork", "spawn") if m in multiprocessing.get_all_start_methods()],
+)
+def test_runner_with_workers_fault_isolation(start_method):
+    nested = "select * from (" * 1000 + "select * from tab9" + ") t" * 1000
+    sql = f"""insert into tab2 select col1 from tab1;
+insert into tab3 {nested};
+insert into tab4 select col1 from crash;
+insert into tab5 select col1 from hang;
+insert into tab6 select col1 from tab2;"""
+    default_start_method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method(start_method, force=True)
+    try:
+        with patch("sqllineage.runner._init_worker", _init_faulty_worker):
+            runner = LineageRunner(sql, workers=2, limits=AnalysisLimits(max_seconds=2))
+            assert runner.source_tables == [Table("tab1")]
+            assert runner.target_tables == [Table("tab6")]
+    finally:
+        multiprocessing.set_start_method(default_start_method, force=True)
+    assert len(runner.warnings) == 3
+    assert "RecursionError" in runner.warnings[0]
+    assert runner.warnings[0].startswith("Statement #2: failed after")
+    assert runner.warnings[1].startswith("Statement #3: failed after")
+    assert "worker process" in runner.warnings[1]
+    assert runner.warnings[2].startswith("Statement #4: skipped")
+
+
+class _RecordingPoolExecutor(ProcessPoolExecutor):
+    sizes: List[int] = []
+
+    def __init__(self, max_workers, *args, **kwargs):
+        self.sizes.append(max_workers)
+        super().__init__(max_workers, *args, **kwargs)
+
+
+def test_runner_with_workers_crash_retry():
+    sql = ";\n".join(
+        f"insert into tab{i + 1} select col1 from {'crash' if i == 5 else f'tab{i}'}"
+        for i in range(12)
+    )
+    with patch("sqllineage.runner._init_worker", _init_faulty_worker), patch(
+        "concurrent.futures.ProcessPoolExecutor", _RecordingPoolExecutor
+    ):
+        runner = LineageRunner(sql, workers=2)
+        assert runner.target_tables == [Table("tab12"), Table("tab5")]
+    assert len(runner.warnings) == 1
+    assert runner.warnings[0].startswith("Statement #6: failed after")
+    # statements not done when the pool breaks go to a new pool, only those running are isolated one by one
+    assert _RecordingPoolExecutor.sizes[:2] == [2, 2]
+    assert 1 <= _RecordingPoolExecutor.sizes.count(1) <= 2
+
+
+def test_schedule_chunks():
+    # 100 in total, target chunk cost 100 // (2 * 4) = 12
+    costs = [1, 50, 2, 3, 20, 1, 2, 1, 15, 5]
+    assert _schedule_chunks(costs, 2) == [[1], [4], [8], [9, 3, 2, 6], [0, 5, 7]]
+    assert _schedule_chunks([], 2) == []
+
+
+def test_runner_memory_profile():
+    sql = "insert into tab2 select col1, col2 from tab1"
+    assert LineageRunner(sql).memory_profile == []
+    runner = LineageRunner(sql, profile_memory=True)
+    assert [p.phase for p in runner.memory_profile] == ["parse", "analyze", "merge"]
+    for p in runner.memory_profile:
+        assert p.peak >= 0
+        assert p.retained == sum(p.retained_by_type.values())
+    assert runner.memory_profile[0].retained_by_type["sqlparse"] > 0
+    assert runner.memory_profile[1].retained_by_type["networkx"] > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_lexer_initialization_thread_safety():
+    default_initialization = Lexer.default_initialization
+
+    def _slow_initialization(self):
+        # widen the window between creating the shared lexer and finishing its initialization
+        time.sleep(0.1)
+        default_initialization(self)
+
+    def _tokenize(_):
+        return list(Lexer.get_default_instance().get_tokens("SELECT col1 FROM tab1"))
+
+    Lexer._default_intance = None
+    with patch.object(Lexer, "default_initialization", _slow_initialization):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(_tokenize, range(4)))
+    assert results == [_tokenize(None)] * 4
+
+
+def _lineage(sql):
+    runner = LineageRunner(sql)
+    return (
+        runner.source_tables,
+        runner.target_tables,
+        runner.intermediate_tables,
+        {str(path) for path in runner.get_column_lineage()},
+    )
+
+
+def test_runner_thread_safety():
+    sqls = [
+        """INSERT OVERWRITE TABLE foo
+SELECT sc.id, q.col1, CAST(sc.dt AS STRING) AS dt, row_number() OVER (PARTITION BY sc.id ORDER BY sc.dt) AS rn
+FROM bar sc
+LATERAL VIEW OUTER explode(sc.json_array) q AS col1""",
+        """insert into tab2 select col1, col2 from tab1;
+insert into tab3 select t2.col1, t4.col2 from tab2 t2 join tab4 t4 on t2.id = t4.id;
+insert into tab5 select * from (select col1 from tab3) dt;""",
+    ]
+    for i in range(1, 6):
+        with open(os.path.join(DATA_FOLDER, "tpcds", f"query{i:02d}.sql")) as f:
+            sqls.append(f.read())
+    expected = [_lineage(sql) for sql in sqls]
+    # threads race to initialize the shared sqlparse lexer as well
+    Lexer._default_intance = None
+    with ThreadPoolExecutor(16) as executor:
+        assert list(executor.map(_lineage, sqls * 4)) == expected * 4
+
+    runner = LineageRunner(sqls[1])
+    barrier = threading.Barrier(8)
+
+    def _column_lineage(_):
+        barrier.wait()
+        return {str(path) for path in runner.get_column_lineage()}
+
+    with patch.object(
+        LineageRunner, "_eval", autospec=True, side_effect=LineageRunner._eval
+    ) as mock_eval:
+        with ThreadPoolExecutor(8) as executor:
+            assert list(executor.map(_column_lineage, range(8))) == [expected[1][3]] * 8
+        assert mock_eval.call_count == 1
+
+
+class CountingSchemaFetcher(DummySchemaFetcher):
+    def __init__(self, table_schema):
+        super().__init__(table_schema)
+        self.lookups = []
+        self.bulk_lookups = []
+
+    def get_schema(self, table, platform=None, account=None):
+        self.lookups.append(table)
+        return super().get_schema(table, platform, account)
+
+    def get_schemas(self, tables, platform=None, account=None):
+        self.bulk_lookups.append(tables)
+        return {table: self._schemas.get(table, []) for table in tables}
+
+
+def test_runner_prefetch_schema():
+    find_column_lineage = Column.find_column_lineage
+    schemas = {
+        "<default>.tab1": ["id", "col1"],
+        "<default>.tab2": ["id", "col2"],
+        "<default>.tab3": ["id", "col3"],
+    }
+    sql = """insert into tab4 select col1, col2 from tab1 join tab2 on tab1.id = tab2.id;
+insert into tab5 select col2, col3 from tab2 join tab3 on tab2.id = tab3.id;
+insert into tab6 select * from tab3;
+insert into tab7 select tab5.col2 from tab5 join tab6 on tab5.col2 = tab6.col3"""
+    fetcher = CountingSchemaFetcher(schemas)
+    runner = LineageRunner(sql, TableMetadata(schema_fetcher=fetcher))
+    expected = runner.get_column_lineage()
+    # cached for the run, each table is looked up once
+    assert sorted(fetcher.lookups) == sorted(schemas)
+    assert fetcher.bulk_lookups == []
+
+    fetcher = CountingSchemaFetcher(schemas)
+    runner = LineageRunner(
+        sql, TableMetadata(schema_fetcher=fetcher), prefetch_schema=True
+    )
+    # each statement is grouped once, and fully analyzed once after the table collection pass
+    with patch(
+        "sqllineage.runner.grouping.group", side_effect=grouping.group
+    ) as group, patch.object(
+        Column, "find_column_lineage", autospec=True, side_effect=find_column_lineage
+    ) as find:
+        assert runner.get_column_lineage() == expected
+    assert group.call_count == 4
+    assert find.call_count == 6
+    assert fetcher.lookups == []
+    assert fetcher.bulk_lookups == [sorted(schemas)]
+
+    fetcher = CountingSchemaFetcher(schemas)
+    runner = LineageRunner(
+        "insert into tab2 select col1 from tab1",
+        TableMetadata(schema_fetcher=fetcher),
+        prefetch_schema=True,
+    )
+    assert runner.get_column_lineage()
+    assert fetcher.lookups == fetcher.bulk_lookups == []
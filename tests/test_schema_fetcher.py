@@ -0,0 +1,87 @@
+import csv
+import json
+import pickle
+import sqlite3
+
+import pytest
+
+from sqllineage.core.models import TableMetadata
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import LineageRunner
+from sqllineage.utils.schemaFetcher import FileSchemaFetcher
+
+ROWS = [
+    {"platform": "", "account": "", "table": "db.Tab1", "column": "id"},
+    {"platform": "", "account": "", "table": "db.Tab1", "column": "col1"},
+    {"platform": "hive", "account": "", "table": "db.tab1", "column": "hive_col"},
+    {"platform": "hive", "account": "acc", "table": "DB.TAB2", "column": "col2"},
+]
+
+
+def _write(path, fmt):
+    if fmt == "json":
+        with open(path, "w") as f:
+            json.dump(ROWS, f)
+    elif fmt == "jsonl":
+        with open(path, "w") as f:
+            f.writelines(json.dumps(row) + "\n" for row in ROWS)
+    elif fmt == "csv":
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, ["platform", "account", "table", "column"])
+            writer.writeheader()
+            writer.writerows(ROWS)
+    else:
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                'CREATE TABLE schemas ("platform", "account", "table", "column")'
+            )
+            conn.execute('CREATE INDEX idx ON schemas ("table" COLLATE NOCASE)')
+            conn.executemany(
+                "INSERT INTO schemas VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        row["platform"] or None,
+                        row["account"],
+                        row["table"],
+                        row["column"],
+                    )
+                    for row in ROWS
+                ],
+            )
+        conn.close()
+
+
+@pytest.mark.parametrize("fmt", ["json", "jsonl", "csv", "sqlite"])
+def test_file_schema_fetcher(tmp_path, fmt):
+    path = str(tmp_path / f"schemas.{fmt}")
+    _write(path, fmt)
+    fetcher = FileSchemaFetcher(path)
+    assert fetcher.get_schema("DB.TAB1") == ["id", "col1"]
+    assert fetcher.get_schema("db.tab1", "Hive") == ["hive_col"]
+    assert fetcher.get_schema("db.tab1", "hive", "other") == ["hive_col"]
+    assert fetcher.get_schema("db.tab2", "hive", "ACC") == ["col2"]
+    assert fetcher.get_schema("db.tab2") == []
+    assert fetcher.get_schema("db.tab3") == []
+    assert fetcher.get_schemas(["db.tab1", "db.Tab2", "db.tab3"], "hive", "acc") == {
+        "db.tab1": ["hive_col"],
+        "db.Tab2": ["col2"],
+        "db.tab3": [],
+    }
+    assert pickle.loads(pickle.dumps(fetcher)).get_schema("db.tab1") == ["id", "col1"]
+
+    runner = LineageRunner(
+        "insert into tab3 select col1 from db.tab1 a join db.tab2 b on a.id = b.id",
+        TableMetadata(schema_fetcher=fetcher),
+    )
+    assert [str(path[0]) for path in runner.get_column_lineage()] == ["db.tab1.col1"]
+
+
+def test_file_schema_fetcher_with_invalid_file(tmp_path):
+    with pytest.raises(SQLLineageException):
+        FileSchemaFetcher(str(tmp_path / "schemas.xml"))
+    with pytest.raises(SQLLineageException):
+        FileSchemaFetcher(str(tmp_path / "schemas.db"), sqlite_table='schemas" --')
+    path = tmp_path / "schemas.jsonl"
+    path.write_text(json.dumps({"table": "tab1"}) + "\n")
+    with pytest.raises(SQLLineageException):
+        FileSchemaFetcher(str(path)).get_schema("tab1")
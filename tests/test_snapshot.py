@@ -0,0 +1,56 @@
+import pytest
+
+from sqllineage.core.serialization import OBJECT_COLUMN, OBJECT_TABLE
+from sqllineage.exceptions import SQLLineageException
+from sqllineage.runner import LineageRunner
+from sqllineage.snapshot import LineageSnapshot, save_snapshot
+from sqllineage.utils.constant import EdgeType, NodeTag
+
+
+def test_snapshot(tmp_path):
+    lr = LineageRunner("""INSERT INTO tab2 SELECT col1, col2 FROM tab1;
+INSERT INTO tab3 SELECT a.col1, b.col3 FROM tab2 a JOIN tab4 b ON a.col2 = b.col2;""")
+    lr._eval()
+    path = str(tmp_path / "lineage.snapshot")
+    save_snapshot(lr._sql_holder, path)
+    with LineageSnapshot(path) as snapshot:
+        assert snapshot.node_count == lr._sql_holder.graph.number_of_nodes()
+        assert snapshot.edge_count == lr._sql_holder.graph.number_of_edges()
+        assert snapshot.source_tables == [str(t) for t in lr.source_tables]
+        assert snapshot.target_tables == [str(t) for t in lr.target_tables]
+        assert snapshot.intermediate_tables == [str(t) for t in lr.intermediate_tables]
+        (tab2,) = snapshot.find("<default>.tab2", OBJECT_TABLE)
+        assert snapshot.name(tab2) == "<default>.tab2"
+        assert snapshot.kind(tab2) == OBJECT_TABLE
+        assert snapshot.has_tag(tab2, NodeTag.READ)
+        assert {
+            snapshot.name(n) for n in snapshot.successors(tab2, EdgeType.LINEAGE)
+        } == {"<default>.tab3"}
+        assert {
+            snapshot.name(n) for n in snapshot.predecessors(tab2, EdgeType.LINEAGE)
+        } == {"<default>.tab1"}
+        (col1,) = snapshot.find("<default>.tab3.col1", OBJECT_COLUMN)
+        assert {snapshot.name(n) for n in snapshot.predecessors(col1)} == {
+            "<default>.tab2.col1",
+            "<default>.tab3",
+        }
+        assert snapshot.find("<default>.tab5") == []
+
+
+def test_snapshot_invalid_file(tmp_path):
+    path = tmp_path / "invalid.snapshot"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(SQLLineageException):
+        LineageSnapshot(str(path))
+
+
+def test_snapshot_truncated_file(tmp_path):
+    lr = LineageRunner("INSERT INTO tab2 SELECT col1 FROM tab1")
+    lr._eval()
+    path = tmp_path / "lineage.snapshot"
+    save_snapshot(lr._sql_holder, str(path))
+    content = path.read_bytes()
+    for truncated in (b"", content[:16], content[:-1]):
+        path.write_bytes(truncated)
+        with pytest.raises(SQLLineageException):
+            LineageSnapshot(str(path))